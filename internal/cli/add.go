@@ -74,12 +74,11 @@ func runAdd(cmd *cobra.Command, args []string) error {
 	// Create relations if specified
 	if len(addRelatesTo) > 0 {
 		for _, rel := range addRelatesTo {
-			parts := strings.SplitN(rel, ":", 2)
-			if len(parts) != 2 {
+			targetID, relType, ok := strings.Cut(rel, ":")
+			if !ok {
 				fmt.Printf("Warning: invalid relation format %q (expected entity:rel_type)\n", rel)
 				continue
 			}
-			targetID, relType := parts[0], parts[1]
 
 			_, err := gqlClient.CreateRelation(ctx, client.CreateRelationInput{
 				FromID:  entity.ID,
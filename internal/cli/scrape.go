@@ -95,6 +95,8 @@ func runScrape(cmd *cobra.Command, args []string) error {
 
 	// Force mode - skip hash checking, use async server-side ingestion
 	if scrapeForce {
+		skipUnchanged := false
+		opts.SkipUnchanged = &skipUnchanged
 		job, err := gqlClient.IngestDirectoryAsync(ctx, path, opts)
 		if err != nil {
 			return fmt.Errorf("start ingest job: %w", err)
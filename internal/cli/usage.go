@@ -45,24 +45,26 @@ func runUsage(cmd *cobra.Command, args []string) error {
 	printServerStats(stats)
 	fmt.Println()
 
-	// Parse since duration
-	var since time.Time
+	// Parse since duration into a lookback window
+	var window time.Duration
 	switch usageSince {
 	case "24h":
-		since = time.Now().Add(-24 * time.Hour)
+		window = 24 * time.Hour
 	case "7d":
-		since = time.Now().Add(-7 * 24 * time.Hour)
+		window = 7 * 24 * time.Hour
 	case "30d":
-		since = time.Now().Add(-30 * 24 * time.Hour)
+		window = 30 * 24 * time.Hour
 	default:
 		// Try parsing as duration
 		d, err := time.ParseDuration(usageSince)
 		if err != nil {
 			return fmt.Errorf("invalid duration: %s", usageSince)
 		}
-		since = time.Now().Add(-d)
+		window = d
 	}
 
+	// UTC cutoff so the server compares against an unambiguous timestamp
+	since := time.Now().UTC().Add(-window)
 	sinceStr := since.Format(time.RFC3339)
 	summary, err := gqlClient.GetUsageSummary(ctx, sinceStr)
 	if err != nil {
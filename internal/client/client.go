@@ -61,9 +61,10 @@ type graphQLRequest struct {
 }
 
 // graphQLResponse is the response payload from GraphQL operations.
+// Data holds the caller's result pointer so the data field decodes in place.
 type graphQLResponse struct {
-	Data   json.RawMessage `json:"data"`
-	Errors []graphQLError  `json:"errors,omitempty"`
+	Data   any            `json:"data"`
+	Errors []graphQLError `json:"errors,omitempty"`
 }
 
 // graphQLError represents a GraphQL error.
@@ -94,30 +95,30 @@ func (c *Client) Execute(ctx context.Context, query string, variables map[string
 	}
 	defer resp.Body.Close()
 
-	body, err := io.ReadAll(resp.Body)
-	if err != nil {
-		return fmt.Errorf("read response: %w", err)
-	}
-
 	if resp.StatusCode != http.StatusOK {
+		body, err := io.ReadAll(resp.Body)
+		if err != nil {
+			return fmt.Errorf("read response: %w", err)
+		}
 		return fmt.Errorf("server error: %s - %s", resp.Status, string(body))
 	}
 
-	var gqlResp graphQLResponse
-	if err := json.Unmarshal(body, &gqlResp); err != nil {
-		return fmt.Errorf("unmarshal response: %w", err)
+	// Decode straight from the body into result, without buffering the whole
+	// response or unmarshalling the data field a second time. Large payloads
+	// (exports, full entity lists) stay at one in-memory copy.
+	var data any = result
+	if result == nil {
+		data = &json.RawMessage{}
+	}
+	gqlResp := graphQLResponse{Data: data}
+	if err := json.NewDecoder(resp.Body).Decode(&gqlResp); err != nil {
+		return fmt.Errorf("decode response: %w", err)
 	}
 
 	if len(gqlResp.Errors) > 0 {
 		return fmt.Errorf("graphql error: %s", gqlResp.Errors[0].Message)
 	}
 
-	if result != nil && len(gqlResp.Data) > 0 {
-		if err := json.Unmarshal(gqlResp.Data, result); err != nil {
-			return fmt.Errorf("unmarshal data: %w", err)
-		}
-	}
-
 	return nil
 }
 
@@ -544,6 +545,8 @@ type IngestOptions struct {
 	ExtractGraph *bool
 	DryRun       *bool
 	Recursive    *bool
+	// SkipUnchanged skips files whose entity already stores the same content hash
+	SkipUnchanged *bool
 }
 
 // Job represents a background processing job.
@@ -630,6 +633,9 @@ func (c *Client) IngestDirectory(ctx context.Context, dirPath string, opts *Inge
 		if opts.Recursive != nil {
 			input["recursive"] = *opts.Recursive
 		}
+		if opts.SkipUnchanged != nil {
+			input["skipUnchanged"] = *opts.SkipUnchanged
+		}
 		vars["input"] = input
 	}
 
@@ -671,6 +677,9 @@ func (c *Client) IngestDirectoryAsync(ctx context.Context, dirPath string, opts
 		if opts.Recursive != nil {
 			input["recursive"] = *opts.Recursive
 		}
+		if opts.SkipUnchanged != nil {
+			input["skipUnchanged"] = *opts.SkipUnchanged
+		}
 		vars["input"] = input
 	}
 
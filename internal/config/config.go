@@ -34,6 +34,7 @@ type Config struct {
 	EmbedModel               string
 	EmbedDimension           int
 	BedrockEmbedModelProvider string // e.g., "amazon" for Titan, "cohere" for Cohere
+	EmbedCacheSize           int    // LRU entries for repeated embedding texts, 0 disables
 
 	// LLM configuration (for ask, extract-graph, render)
 	LLMProvider LLMProvider
@@ -69,6 +70,7 @@ func Load() Config {
 		EmbedModel:               getEnv("KNOWHOW_EMBED_MODEL", "bge-m3"),
 		EmbedDimension:           getEnvInt("KNOWHOW_EMBED_DIMENSION", 1024),
 		BedrockEmbedModelProvider: getEnv("KNOWHOW_BEDROCK_EMBED_MODEL_PROVIDER", ""),
+		EmbedCacheSize:           getEnvInt("KNOWHOW_EMBED_CACHE_SIZE", 1024),
 
 		// LLM (default to local Ollama)
 		LLMProvider: LLMProvider(getEnv("KNOWHOW_LLM_PROVIDER", "ollama")),
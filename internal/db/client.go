@@ -3,7 +3,9 @@ package db
 
 import (
 	"context"
+	"crypto/sha256"
 	"crypto/tls"
+	"encoding/hex"
 	"fmt"
 	"log/slog"
 	"strings"
@@ -247,16 +249,49 @@ func (c *Client) DB() *surrealdb.DB {
 }
 
 // InitSchema initializes the database schema with the given embedding dimension.
+// A hash of the applied schema is recorded in schema_meta, so restarts with an
+// unchanged schema skip re-running every DEFINE statement.
 func (c *Client) InitSchema(ctx context.Context, embedDimension int) error {
-	c.logger.Info("initializing database schema", "embed_dimension", embedDimension)
-	_, err := surrealdb.Query[any](ctx, c.db, SchemaSQL(embedDimension), nil)
+	schema := SchemaSQL(embedDimension)
+	sum := sha256.Sum256([]byte(schema))
+	hash := hex.EncodeToString(sum[:])
+
+	applied, err := c.appliedSchemaHash(ctx)
 	if err != nil {
+		c.logger.Debug("could not read applied schema hash, applying schema", "error", err)
+	} else if applied == hash {
+		c.logger.Info("database schema up to date", "embed_dimension", embedDimension)
+		return nil
+	}
+
+	c.logger.Info("initializing database schema", "embed_dimension", embedDimension)
+	if _, err := surrealdb.Query[any](ctx, c.db, schema, nil); err != nil {
 		return fmt.Errorf("init schema: %w", err)
 	}
+
+	if _, err := surrealdb.Query[any](ctx, c.db, `
+		UPSERT schema_meta:current SET hash = $hash, applied_at = time::now() RETURN NONE
+	`, map[string]any{"hash": hash}); err != nil {
+		// Not fatal: the schema is applied, the next start just re-runs it
+		c.logger.Warn("failed to record schema hash", "error", err)
+	}
 	c.logger.Info("schema initialization complete")
 	return nil
 }
 
+// appliedSchemaHash returns the hash of the last applied schema, or "" if none
+// has been recorded yet.
+func (c *Client) appliedSchemaHash(ctx context.Context) (string, error) {
+	results, err := surrealdb.Query[*string](ctx, c.db, `RETURN schema_meta:current.hash`, nil)
+	if err != nil {
+		return "", fmt.Errorf("get schema hash: %w", err)
+	}
+	if results == nil || len(*results) == 0 || (*results)[0].Result == nil {
+		return "", nil
+	}
+	return *(*results)[0].Result, nil
+}
+
 // Query executes a SurrealQL query with parameters.
 // Returns the raw query results as []surrealdb.QueryResult[any].
 func (c *Client) Query(ctx context.Context, sql string, vars map[string]any) (*[]surrealdb.QueryResult[any], error) {
@@ -3,65 +3,44 @@ package db
 
 import (
 	"context"
-	"fmt"
 	"log"
 	"os"
+	"strings"
 	"testing"
 	"time"
 
 	"github.com/raphaelgruber/memcp-go/internal/models"
+	"github.com/raphaelgruber/memcp-go/internal/testutil"
+	"github.com/surrealdb/surrealdb.go"
 	"github.com/testcontainers/testcontainers-go"
-	"github.com/testcontainers/testcontainers-go/wait"
 )
 
 var testDB *Client
+var testConfig Config
 var testContainer testcontainers.Container
 
 // TestMain sets up and tears down the SurrealDB container for all tests.
 func TestMain(m *testing.M) {
-	// Disable ryuk (cleanup container) as it can cause issues in some environments
-	os.Setenv("TESTCONTAINERS_RYUK_DISABLED", "true")
-
 	ctx := context.Background()
 
 	// Start SurrealDB container
+	var url string
 	var err error
-	testContainer, err = testcontainers.GenericContainer(ctx, testcontainers.GenericContainerRequest{
-		ContainerRequest: testcontainers.ContainerRequest{
-			Image:        "surrealdb/surrealdb:v3.0.0-beta.1",
-			ExposedPorts: []string{"8000/tcp"},
-			Cmd:          []string{"start", "--log", "info", "--user", "root", "--pass", "root"},
-			WaitingFor:   wait.ForLog("Started web server").WithStartupTimeout(60 * time.Second),
-		},
-		Started: true,
-	})
+	testContainer, url, err = testutil.StartSurrealDB(ctx)
 	if err != nil {
-		log.Fatalf("Failed to start SurrealDB container: %v", err)
-	}
-
-	// Get container host and port
-	host, err := testContainer.Host(ctx)
-	if err != nil {
-		log.Fatalf("Failed to get container host: %v", err)
-	}
-	// Workaround: testcontainers may return "null" as host in some environments
-	if host == "" || host == "null" {
-		host = "localhost"
-	}
-	mappedPort, err := testContainer.MappedPort(ctx, "8000")
-	if err != nil {
-		log.Fatalf("Failed to get mapped port: %v", err)
+		log.Fatalf("Failed to start SurrealDB: %v", err)
 	}
 
 	// Connect to test database
-	testDB, err = NewClient(ctx, Config{
-		URL:       fmt.Sprintf("ws://%s:%s/rpc", host, mappedPort.Port()),
+	testConfig = Config{
+		URL:       url,
 		Namespace: "test",
 		Database:  "test",
 		Username:  "root",
 		Password:  "root",
 		AuthLevel: "root",
-	}, nil, nil)
+	}
+	testDB, err = NewClient(ctx, testConfig, nil, nil)
 	if err != nil {
 		log.Fatalf("Failed to connect to test database: %v", err)
 	}
@@ -91,6 +70,73 @@ func dummyEmbedding() []float32 {
 	return embedding
 }
 
+// =============================================================================
+// SCHEMA TESTS
+// =============================================================================
+
+// schemaMeta reads the recorded schema hash and when it was applied.
+func schemaMeta(t *testing.T, client *Client) (string, time.Time) {
+	t.Helper()
+	results, err := surrealdb.Query[[]struct {
+		Hash      string    `json:"hash"`
+		AppliedAt time.Time `json:"applied_at"`
+	}](context.Background(), client.db, `SELECT hash, applied_at FROM schema_meta:current`, nil)
+	if err != nil {
+		t.Fatalf("Failed to read schema_meta: %v", err)
+	}
+	if results == nil || len(*results) == 0 || len((*results)[0].Result) == 0 {
+		t.Fatal("Expected a schema_meta record")
+	}
+	meta := (*results)[0].Result[0]
+	return meta.Hash, meta.AppliedAt
+}
+
+func TestInitSchema(t *testing.T) {
+	ctx := context.Background()
+
+	// Use a separate database so the shared one keeps its schema
+	cfg := testConfig
+	cfg.Database = "schema_test"
+	client, err := NewClient(ctx, cfg, nil, nil)
+	if err != nil {
+		t.Fatalf("Failed to connect: %v", err)
+	}
+	defer func() {
+		if err := client.Close(ctx); err != nil {
+			t.Logf("Failed to close client: %v", err)
+		}
+	}()
+
+	if err := client.InitSchema(ctx, 384); err != nil {
+		t.Fatalf("First InitSchema failed: %v", err)
+	}
+	hash, appliedAt := schemaMeta(t, client)
+
+	t.Run("unchanged schema is skipped", func(t *testing.T) {
+		if err := client.InitSchema(ctx, 384); err != nil {
+			t.Fatalf("Second InitSchema failed: %v", err)
+		}
+		gotHash, gotAppliedAt := schemaMeta(t, client)
+		if gotHash != hash || !gotAppliedAt.Equal(appliedAt) {
+			t.Errorf("Expected schema to be left as is, got hash %q applied at %v (was %q at %v)",
+				gotHash, gotAppliedAt, hash, appliedAt)
+		}
+	})
+
+	t.Run("changed dimension is re-applied", func(t *testing.T) {
+		if err := client.InitSchema(ctx, 768); err != nil {
+			t.Fatalf("InitSchema with new dimension failed: %v", err)
+		}
+		gotHash, gotAppliedAt := schemaMeta(t, client)
+		if gotHash == hash {
+			t.Error("Expected schema hash to change with the dimension")
+		}
+		if !gotAppliedAt.After(appliedAt) {
+			t.Errorf("Expected schema to be re-applied after %v, got %v", appliedAt, gotAppliedAt)
+		}
+	})
+}
+
 // =============================================================================
 // ENTITY TESTS
 // =============================================================================
@@ -353,6 +399,132 @@ func TestDeleteEntity(t *testing.T) {
 	}
 }
 
+func TestUpdateEntitiesAccess(t *testing.T) {
+	ctx := context.Background()
+
+	content := "Access test"
+	var ids []string
+	for _, name := range []string{"Access Test One", "Access Test Two"} {
+		created, err := testDB.CreateEntity(ctx, models.EntityInput{
+			Type:      "concept",
+			Name:      name,
+			Content:   &content,
+			Embedding: dummyEmbedding(),
+		})
+		if err != nil {
+			t.Fatalf("Failed to create test entity: %v", err)
+		}
+		ids = append(ids, models.MustRecordIDString(created.ID))
+	}
+	defer func() {
+		for _, id := range ids {
+			_, _ = testDB.DeleteEntity(ctx, id)
+		}
+	}()
+
+	if err := testDB.UpdateEntitiesAccess(ctx, ids); err != nil {
+		t.Fatalf("UpdateEntitiesAccess failed: %v", err)
+	}
+
+	for _, id := range ids {
+		entity, err := testDB.GetEntity(ctx, id)
+		if err != nil {
+			t.Fatalf("GetEntity failed: %v", err)
+		}
+		if entity.AccessCount != 1 {
+			t.Errorf("Expected access count 1 for %s, got %d", id, entity.AccessCount)
+		}
+	}
+
+	// Empty input is a no-op
+	if err := testDB.UpdateEntitiesAccess(ctx, nil); err != nil {
+		t.Errorf("UpdateEntitiesAccess with no IDs should not error: %v", err)
+	}
+}
+
+func TestAccessEntity(t *testing.T) {
+	ctx := context.Background()
+
+	content := "Access entity test"
+	created, err := testDB.CreateEntity(ctx, models.EntityInput{
+		Type:      "concept",
+		Name:      "Access Entity Test",
+		Content:   &content,
+		Embedding: dummyEmbedding(),
+	})
+	if err != nil {
+		t.Fatalf("Failed to create test entity: %v", err)
+	}
+	entityID := models.MustRecordIDString(created.ID)
+	defer func() {
+		_, _ = testDB.DeleteEntity(ctx, entityID)
+	}()
+
+	entity, err := testDB.AccessEntity(ctx, entityID, false)
+	if err != nil {
+		t.Fatalf("AccessEntity failed: %v", err)
+	}
+	if entity == nil || entity.AccessCount != 1 {
+		t.Fatalf("Expected entity with access count 1, got %+v", entity)
+	}
+	if len(entity.Embedding) != 0 {
+		t.Error("AccessEntity should omit the embedding")
+	}
+	if len(entity.Relations) != 0 {
+		t.Errorf("Expected no relations, got %d", len(entity.Relations))
+	}
+
+	otherContent := "Access entity relation target"
+	other, err := testDB.CreateEntity(ctx, models.EntityInput{
+		Type:      "concept",
+		Name:      "Access Entity Target",
+		Content:   &otherContent,
+		Embedding: dummyEmbedding(),
+	})
+	if err != nil {
+		t.Fatalf("Failed to create relation target: %v", err)
+	}
+	otherID := models.MustRecordIDString(other.ID)
+	defer func() {
+		_, _ = testDB.DeleteEntity(ctx, otherID)
+	}()
+	if err := testDB.CreateRelation(ctx, models.RelationInput{
+		FromID:  otherID,
+		ToID:    entityID,
+		RelType: "access_rel",
+	}); err != nil {
+		t.Fatalf("CreateRelation failed: %v", err)
+	}
+
+	entity, err = testDB.AccessEntityByName(ctx, "access entity test", true)
+	if err != nil {
+		t.Fatalf("AccessEntityByName failed: %v", err)
+	}
+	if entity == nil || entity.AccessCount != 2 {
+		t.Fatalf("Expected entity with access count 2, got %+v", entity)
+	}
+	if len(entity.Relations) != 1 || entity.Relations[0].RelType != "access_rel" {
+		t.Errorf("Expected the incoming access_rel relation, got %+v", entity.Relations)
+	}
+
+	// Relations are only loaded when requested
+	entity, err = testDB.AccessEntity(ctx, entityID, false)
+	if err != nil {
+		t.Fatalf("AccessEntity failed: %v", err)
+	}
+	if entity == nil || len(entity.Relations) != 0 {
+		t.Errorf("Expected no relations without withRelations, got %+v", entity)
+	}
+
+	// Non-existent entities return nil without error
+	if entity, err := testDB.AccessEntity(ctx, "non-existent-id", true); err != nil || entity != nil {
+		t.Errorf("AccessEntity with non-existent ID should return nil, got %v, %v", entity, err)
+	}
+	if entity, err := testDB.AccessEntityByName(ctx, "No Such Entity", false); err != nil || entity != nil {
+		t.Errorf("AccessEntityByName with unknown name should return nil, got %v, %v", entity, err)
+	}
+}
+
 func TestUpsertEntity(t *testing.T) {
 	ctx := context.Background()
 
@@ -644,6 +816,122 @@ func TestCreateAndGetRelations(t *testing.T) {
 	}
 }
 
+func TestCreateRelations(t *testing.T) {
+	ctx := context.Background()
+
+	var ids []string
+	for _, name := range []string{"Batch Rel Test 1", "Batch Rel Test 2", "Batch Rel Test 3"} {
+		content := name + " content"
+		entity, err := testDB.CreateEntity(ctx, models.EntityInput{
+			Type:      "concept",
+			Name:      name,
+			Content:   &content,
+			Embedding: dummyEmbedding(),
+		})
+		if err != nil {
+			t.Fatalf("Failed to create entity %q: %v", name, err)
+		}
+		ids = append(ids, models.MustRecordIDString(entity.ID))
+	}
+	defer func() {
+		for _, id := range ids {
+			_, _ = testDB.DeleteEntity(ctx, id)
+		}
+	}()
+
+	// The repeated pair must update the existing relation, not add another
+	strength := 0.5
+	err := testDB.CreateRelations(ctx, []models.RelationInput{
+		{FromID: ids[0], ToID: ids[1], RelType: "batch_rel"},
+		{FromID: ids[0], ToID: ids[2], RelType: "batch_rel"},
+		{FromID: ids[1], ToID: ids[0], RelType: "batch_rel", Strength: &strength},
+	})
+	if err != nil {
+		t.Fatalf("CreateRelations failed: %v", err)
+	}
+
+	relations, err := testDB.GetRelations(ctx, ids[0])
+	if err != nil {
+		t.Fatalf("GetRelations failed: %v", err)
+	}
+	count := 0
+	for _, rel := range relations {
+		if rel.RelType == "batch_rel" {
+			count++
+		}
+	}
+	if count != 2 {
+		t.Errorf("Expected 2 batch_rel relations, got %d", count)
+	}
+
+	if err := testDB.CreateRelations(ctx, nil); err != nil {
+		t.Errorf("CreateRelations with no input failed: %v", err)
+	}
+}
+
+func TestCreateRelations_IsolatesFailures(t *testing.T) {
+	ctx := context.Background()
+
+	var ids []string
+	for _, name := range []string{"Isolated Rel Test 1", "Isolated Rel Test 2", "Isolated Rel Test 3"} {
+		content := name + " content"
+		entity, err := testDB.CreateEntity(ctx, models.EntityInput{
+			Type:      "concept",
+			Name:      name,
+			Content:   &content,
+			Embedding: dummyEmbedding(),
+		})
+		if err != nil {
+			t.Fatalf("Failed to create entity %q: %v", name, err)
+		}
+		ids = append(ids, models.MustRecordIDString(entity.ID))
+	}
+	defer func() {
+		for _, id := range ids {
+			_, _ = testDB.DeleteEntity(ctx, id)
+		}
+	}()
+
+	// Metadata that can't be encoded fails the batch; the good relations
+	// around it must still be written
+	err := testDB.CreateRelations(ctx, []models.RelationInput{
+		{FromID: ids[0], ToID: ids[1], RelType: "isolated_rel"},
+		{FromID: ids[0], ToID: ids[2], RelType: "isolated_bad", Metadata: map[string]any{"bad": make(chan int)}},
+		{FromID: ids[1], ToID: ids[2], RelType: "isolated_rel"},
+	})
+	if err == nil {
+		t.Fatal("Expected an error for the bad relation")
+	}
+	if !strings.Contains(err.Error(), "1 of 3 failed") {
+		t.Errorf("Expected error to report 1 of 3 failed, got: %v", err)
+	}
+
+	relations, err := testDB.GetRelations(ctx, ids[2])
+	if err != nil {
+		t.Fatalf("GetRelations failed: %v", err)
+	}
+	good, bad := 0, 0
+	for _, rel := range relations {
+		switch rel.RelType {
+		case "isolated_rel":
+			good++
+		case "isolated_bad":
+			bad++
+		}
+	}
+	if good != 1 || bad != 0 {
+		t.Errorf("Expected 1 isolated_rel and 0 isolated_bad relations on entity 3, got %d and %d", good, bad)
+	}
+
+	relations, err = testDB.GetRelations(ctx, ids[0])
+	if err != nil {
+		t.Fatalf("GetRelations failed: %v", err)
+	}
+	if len(relations) != 1 {
+		t.Errorf("Expected 1 relation on entity 1, got %d", len(relations))
+	}
+}
+
 func TestDeleteRelation(t *testing.T) {
 	ctx := context.Background()
 
@@ -782,6 +1070,12 @@ func TestTokenUsage(t *testing.T) {
 	if summary.TotalTokens < 150 {
 		t.Errorf("Expected at least 150 total tokens, got %d", summary.TotalTokens)
 	}
+	if summary.ByOperation["test_embed"] < 150 {
+		t.Errorf("Expected at least 150 tokens for test_embed, got %d", summary.ByOperation["test_embed"])
+	}
+	if summary.ByModel["test-model"] < 150 {
+		t.Errorf("Expected at least 150 tokens for test-model, got %d", summary.ByModel["test-model"])
+	}
 }
 
 func TestGetExistingHashes(t *testing.T) {
@@ -849,3 +1143,45 @@ func TestGetExistingHashes(t *testing.T) {
 		t.Errorf("Expected empty result, got %v", empty)
 	}
 }
+
+func TestListLabels(t *testing.T) {
+	ctx := context.Background()
+
+	content := "label count content"
+	inputs := []models.EntityInput{
+		{Type: "concept", Name: "Label Count 1", Labels: []string{"lc-shared", "lc-one"}},
+		{Type: "concept", Name: "Label Count 2", Labels: []string{"lc-shared"}},
+		{Type: "concept", Name: "Label Count 3"},
+	}
+	for _, input := range inputs {
+		input.Content = &content
+		input.Embedding = dummyEmbedding()
+		entity, err := testDB.CreateEntity(ctx, input)
+		if err != nil {
+			t.Fatalf("CreateEntity %q failed: %v", input.Name, err)
+		}
+		id := models.MustRecordIDString(entity.ID)
+		defer func() {
+			_, _ = testDB.DeleteEntity(ctx, id)
+		}()
+	}
+
+	labels, err := testDB.ListLabels(ctx)
+	if err != nil {
+		t.Fatalf("ListLabels failed: %v", err)
+	}
+
+	counts := make(map[string]int)
+	for i, lc := range labels {
+		counts[lc.Label] = lc.Count
+		if i > 0 && labels[i-1].Count < lc.Count {
+			t.Errorf("Labels not sorted by count: %v", labels)
+		}
+	}
+	if counts["lc-shared"] != 2 {
+		t.Errorf("Expected lc-shared count 2, got %d", counts["lc-shared"])
+	}
+	if counts["lc-one"] != 1 {
+		t.Errorf("Expected lc-one count 1, got %d", counts["lc-one"])
+	}
+}
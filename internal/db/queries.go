@@ -3,6 +3,7 @@ package db
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"strings"
 
@@ -45,6 +46,22 @@ func optionalEmbedding(e []float32) any {
 	return e
 }
 
+// entityRecordID returns a typed entity record ID. Binding it as a parameter
+// sends the record ID as-is instead of having the server build it from a
+// string with type::record on every call.
+func entityRecordID(id string) surrealmodels.RecordID {
+	return surrealmodels.NewRecordID("entity", id)
+}
+
+// entityRecordIDs converts entity IDs to typed record IDs for batch queries.
+func entityRecordIDs(ids []string) []surrealmodels.RecordID {
+	recs := make([]surrealmodels.RecordID, len(ids))
+	for i, id := range ids {
+		recs[i] = entityRecordID(id)
+	}
+	return recs
+}
+
 // =============================================================================
 // ENTITY QUERIES
 // =============================================================================
@@ -125,6 +142,12 @@ func (c *Client) CreateEntity(ctx context.Context, input models.EntityInput) (*m
 	return &(*results)[0].Result[0], nil
 }
 
+// upsertEntityResult is the combined result of the UpsertEntity query.
+type upsertEntityResult struct {
+	Created bool           `json:"created"`
+	Entity  *models.Entity `json:"entity"`
+}
+
 // UpsertEntity creates a new entity or updates an existing one by ID.
 // If entity with the ID exists, updates content, hash, summary, labels, source_path.
 // If not, creates a new entity. Returns the entity and whether it was created (vs updated).
@@ -138,13 +161,6 @@ func (c *Client) UpsertEntity(ctx context.Context, input models.EntityInput) (*m
 		id = *input.ID
 	}
 
-	// Check if entity exists before upsert to determine if this is a create or update
-	existing, err := c.GetEntity(ctx, id)
-	if err != nil {
-		return nil, false, fmt.Errorf("check existing entity: %w", err)
-	}
-	wasCreated := existing == nil
-
 	// Ensure labels is not nil
 	labels := input.Labels
 	if labels == nil {
@@ -165,9 +181,13 @@ func (c *Client) UpsertEntity(ctx context.Context, input models.EntityInput) (*m
 		verified = *input.Verified
 	}
 
-	// Use SurrealDB UPSERT - creates if not exists, updates if exists
+	// Use SurrealDB UPSERT - creates if not exists, updates if exists.
+	// The existence check runs in the same query to report create vs update
+	// without a separate round-trip.
 	sql := `
-		UPSERT type::record("entity", $id) SET
+		LET $rec = type::record("entity", $id);
+		LET $created = !record::exists($rec);
+		LET $entity = (UPSERT $rec SET
 			type = $type,
 			name = $name,
 			content = $content,
@@ -181,10 +201,11 @@ func (c *Client) UpsertEntity(ctx context.Context, input models.EntityInput) (*m
 			metadata = $metadata,
 			embedding = $embedding,
 			access_count = IF access_count THEN access_count ELSE 0 END
-		RETURN AFTER
+		RETURN AFTER)[0];
+		RETURN { created: $created, entity: $entity };
 	`
 
-	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, sql, map[string]any{
+	results, err := surrealdb.Query[*upsertEntityResult](ctx, c.db, sql, map[string]any{
 		"id":           id,
 		"type":         input.Type,
 		"name":         input.Name,
@@ -203,24 +224,28 @@ func (c *Client) UpsertEntity(ctx context.Context, input models.EntityInput) (*m
 		return nil, false, fmt.Errorf("upsert entity: %w", wrapQueryError(err))
 	}
 
-	if results == nil || len(*results) == 0 || len((*results)[0].Result) == 0 {
+	// Result is in the last RETURN statement
+	if results == nil || len(*results) == 0 {
+		return nil, false, fmt.Errorf("upsert entity: no result returned")
+	}
+	result := (*results)[len(*results)-1].Result
+	if result == nil || result.Entity == nil {
 		return nil, false, fmt.Errorf("upsert entity: no result returned")
 	}
 
-	entity := &(*results)[0].Result[0]
-
-	return entity, wasCreated, nil
+	return result.Entity, result.Created, nil
 }
 
 // GetEntity retrieves an entity by ID.
+// The embedding is omitted; no reader needs it and it dominates the payload.
 // Returns nil if not found.
 func (c *Client) GetEntity(ctx context.Context, id string) (*models.Entity, error) {
 	start := c.startOp()
 	defer c.recordTiming(metrics.OpDBQuery, start)
 
 	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, `
-		SELECT * FROM type::record("entity", $id)
-	`, map[string]any{"id": id})
+		SELECT * OMIT embedding FROM $id
+	`, map[string]any{"id": entityRecordID(id)})
 
 	if err != nil {
 		return nil, fmt.Errorf("get entity: %w", err)
@@ -236,7 +261,7 @@ func (c *Client) GetEntity(ctx context.Context, id string) (*models.Entity, erro
 // Returns nil if not found.
 func (c *Client) GetEntityByName(ctx context.Context, name string) (*models.Entity, error) {
 	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, `
-		SELECT * FROM entity WHERE string::lowercase(name) = string::lowercase($name) LIMIT 1
+		SELECT * OMIT embedding FROM entity WHERE string::lowercase(name) = string::lowercase($name) LIMIT 1
 	`, map[string]any{"name": name})
 
 	if err != nil {
@@ -264,7 +289,7 @@ func (c *Client) GetEntitiesByNames(ctx context.Context, names []string) (map[st
 	}
 
 	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, `
-		SELECT * FROM entity WHERE string::lowercase(name) IN $names
+		SELECT * OMIT embedding FROM entity WHERE string::lowercase(name) IN $names
 	`, map[string]any{"names": lowerNames})
 
 	if err != nil {
@@ -358,9 +383,9 @@ func (c *Client) DeleteEntity(ctx context.Context, id string) (bool, error) {
 	start := c.startOp()
 	defer c.recordTiming(metrics.OpDBQuery, start)
 
-	sql := `DELETE type::record("entity", $id) RETURN BEFORE`
+	sql := `DELETE $id RETURN BEFORE`
 
-	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, sql, map[string]any{"id": id})
+	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, sql, map[string]any{"id": entityRecordID(id)})
 	if err != nil {
 		return false, fmt.Errorf("delete entity: %w", err)
 	}
@@ -371,15 +396,73 @@ func (c *Client) DeleteEntity(ctx context.Context, id string) (bool, error) {
 	return true, nil
 }
 
-// UpdateEntityAccess updates access tracking for an entity.
-func (c *Client) UpdateEntityAccess(ctx context.Context, id string) error {
+// AccessEntity retrieves an entity by ID and updates its access tracking in a
+// single round-trip. With withRelations, its relations are loaded as well.
+// Returns nil if not found.
+func (c *Client) AccessEntity(ctx context.Context, id string, withRelations bool) (*models.Entity, error) {
+	return c.accessEntity(ctx, "", map[string]any{"rec": entityRecordID(id)}, withRelations)
+}
+
+// AccessEntityByName retrieves an entity by name (case-insensitive) and updates
+// its access tracking in a single round-trip. With withRelations, its
+// relations are loaded as well. Returns nil if not found.
+func (c *Client) AccessEntityByName(ctx context.Context, name string, withRelations bool) (*models.Entity, error) {
+	return c.accessEntity(ctx, `
+		LET $rec = (SELECT VALUE id FROM entity WHERE string::lowercase(name) = string::lowercase($name) LIMIT 1);
+	`, map[string]any{"name": name}, withRelations)
+}
+
+// accessEntity bumps access tracking on the record(s) in $rec and returns the
+// updated entity. $rec is either passed in vars or bound by the given LET
+// statement. Relations are read by traversing the record's edges, so they
+// need no second query (or relates_to table scan), but are only loaded on
+// request since heavily linked entities can have many.
+func (c *Client) accessEntity(ctx context.Context, bindRecord string, vars map[string]any, withRelations bool) (*models.Entity, error) {
+	start := c.startOp()
+	defer c.recordTiming(metrics.OpDBQuery, start)
+
+	selectSQL := `SELECT * OMIT embedding FROM $rec;`
+	if withRelations {
+		selectSQL = `SELECT *, <->relates_to.* AS relations OMIT embedding FROM $rec;`
+	}
+	sql := bindRecord + `
+		UPDATE $rec SET
+			accessed = time::now(),
+			access_count += 1
+		RETURN NONE;
+		` + selectSQL
+
+	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, sql, vars)
+	if err != nil {
+		return nil, fmt.Errorf("access entity: %w", err)
+	}
+
+	// Result is in the last SELECT statement
+	if results == nil || len(*results) == 0 {
+		return nil, nil
+	}
+	lastIdx := len(*results) - 1
+	if len((*results)[lastIdx].Result) == 0 {
+		return nil, nil
+	}
+	return &(*results)[lastIdx].Result[0], nil
+}
+
+// UpdateEntitiesAccess updates access tracking for several entities in a
+// single statement, avoiding one round-trip per entity.
+func (c *Client) UpdateEntitiesAccess(ctx context.Context, ids []string) error {
+	if len(ids) == 0 {
+		return nil
+	}
+
 	_, err := surrealdb.Query[any](ctx, c.db, `
-		UPDATE type::record("entity", $id) SET
+		UPDATE $ids SET
 			accessed = time::now(),
 			access_count += 1
-	`, map[string]any{"id": id})
+		RETURN NONE
+	`, map[string]any{"ids": entityRecordIDs(ids)})
 	if err != nil {
-		return fmt.Errorf("update entity access: %w", err)
+		return fmt.Errorf("update entities access: %w", err)
 	}
 	return nil
 }
@@ -414,6 +497,22 @@ func (c *Client) GetExistingHashes(ctx context.Context, hashes []string) ([]stri
 	return existing, nil
 }
 
+// GetContentHash returns the content hash stored on an entity, or nil when the
+// entity doesn't exist or has no hash.
+func (c *Client) GetContentHash(ctx context.Context, id string) (*string, error) {
+	results, err := surrealdb.Query[*string](ctx, c.db, `RETURN $rec.content_hash`, map[string]any{
+		"rec": entityRecordID(id),
+	})
+	if err != nil {
+		return nil, fmt.Errorf("get content hash: %w", err)
+	}
+
+	if results == nil || len(*results) == 0 {
+		return nil, nil
+	}
+	return (*results)[0].Result, nil
+}
+
 // =============================================================================
 // SEARCH QUERIES
 // =============================================================================
@@ -428,6 +527,28 @@ type SearchOptions struct {
 	Limit        int       // Max results (default 10)
 }
 
+// searchFilter builds the filter clause shared by all search statements,
+// binding filter values into vars. The clause is empty or starts with "AND".
+func searchFilter(opts SearchOptions, vars map[string]any) string {
+	var filterClauses []string
+	if len(opts.Labels) > 0 {
+		filterClauses = append(filterClauses, "labels CONTAINSANY $labels")
+		vars["labels"] = opts.Labels
+	}
+	if len(opts.Types) > 0 {
+		filterClauses = append(filterClauses, "type IN $types")
+		vars["types"] = opts.Types
+	}
+	if opts.VerifiedOnly {
+		filterClauses = append(filterClauses, "verified = true")
+	}
+
+	if len(filterClauses) == 0 {
+		return ""
+	}
+	return "AND " + strings.Join(filterClauses, " AND ")
+}
+
 // HybridSearch performs RRF fusion of BM25 + vector search results.
 // Returns entities ranked by combined relevance score.
 func (c *Client) HybridSearch(ctx context.Context, opts SearchOptions) ([]models.Entity, error) {
@@ -439,35 +560,17 @@ func (c *Client) HybridSearch(ctx context.Context, opts SearchOptions) ([]models
 		limit = 10
 	}
 
-	// Build dynamic filter clauses
-	filterClauses := []string{}
 	vars := map[string]any{
 		"q":     opts.Query,
 		"emb":   opts.Embedding,
 		"limit": limit,
 	}
-
-	if len(opts.Labels) > 0 {
-		filterClauses = append(filterClauses, "labels CONTAINSANY $labels")
-		vars["labels"] = opts.Labels
-	}
-	if len(opts.Types) > 0 {
-		filterClauses = append(filterClauses, "type IN $types")
-		vars["types"] = opts.Types
-	}
-	if opts.VerifiedOnly {
-		filterClauses = append(filterClauses, "verified = true")
-	}
-
-	filterClause := ""
-	if len(filterClauses) > 0 {
-		filterClause = "AND " + strings.Join(filterClauses, " AND ")
-	}
+	filterClause := searchFilter(opts, vars)
 
 	// RRF fusion query - combines vector (2x limit for variety) with BM25
 	// Note: parentheses around OR clause ensure filter applies correctly
 	sql := fmt.Sprintf(`
-		SELECT * FROM search::rrf([
+		SELECT * OMIT embedding FROM search::rrf([
 			(SELECT * FROM entity
 			 WHERE embedding <|%d,60|> $emb %s),
 			(SELECT * FROM entity
@@ -497,32 +600,13 @@ func (c *Client) SearchWithChunks(ctx context.Context, opts SearchOptions) ([]mo
 		limit = 10
 	}
 
-	// Build filter clause
-	filterClauses := []string{}
 	vars := map[string]any{
-		"q":     opts.Query,
-		"emb":   opts.Embedding,
-		"limit": limit,
-	}
-
-	if len(opts.Labels) > 0 {
-		filterClauses = append(filterClauses, "labels CONTAINSANY $labels")
-		vars["labels"] = opts.Labels
-	}
-	if len(opts.Types) > 0 {
-		filterClauses = append(filterClauses, "type IN $types")
-		vars["types"] = opts.Types
-	}
-	if opts.VerifiedOnly {
-		filterClauses = append(filterClauses, "verified = true")
-	}
-
-	filterClause := ""
-	chunkFilterClause := ""
-	if len(filterClauses) > 0 {
-		filterClause = "AND " + strings.Join(filterClauses, " AND ")
-		chunkFilterClause = "AND " + strings.Join(filterClauses, " AND ")
+		"q":         opts.Query,
+		"emb":       opts.Embedding,
+		"limit":     limit,
+		"rrf_limit": limit * 2,
 	}
+	filterClause := searchFilter(opts, vars)
 
 	// Search entities and chunks, then aggregate by entity
 	sql := fmt.Sprintf(`
@@ -530,7 +614,7 @@ func (c *Client) SearchWithChunks(ctx context.Context, opts SearchOptions) ([]mo
 			SELECT *, [] AS matched_chunks FROM search::rrf([
 				(SELECT * FROM entity WHERE embedding <|%d,60|> $emb %s),
 				(SELECT * FROM entity WHERE content @0@ $q OR name @1@ $q %s)
-			], %d, 60)
+			], $rrf_limit, 60)
 		);
 
 		LET $chunk_hits = (
@@ -540,11 +624,11 @@ func (c *Client) SearchWithChunks(ctx context.Context, opts SearchOptions) ([]mo
 			WHERE embedding <|%d,60|> $emb %s
 		);
 
-		-- Merge entity hits with chunk hits
-		RETURN array::distinct(array::concat($entity_hits, $chunk_hits.map(|$c|
+		-- Merge entity hits with chunk hits; embeddings stay server-side
+		RETURN SELECT * OMIT embedding FROM array::distinct(array::concat($entity_hits, $chunk_hits.map(|$c|
 			object::extend($c.entity, { matched_chunks: $c.matched_chunks })
 		))).slice(0, $limit)
-	`, limit*2, filterClause, filterClause, limit*2, limit*3, chunkFilterClause)
+	`, limit*2, filterClause, filterClause, limit*3, filterClause)
 
 	results, err := surrealdb.Query[[]models.EntitySearchResult](ctx, c.db, sql, vars)
 	if err != nil {
@@ -564,47 +648,48 @@ func (c *Client) SearchWithChunks(ctx context.Context, opts SearchOptions) ([]mo
 // =============================================================================
 
 // CreateChunks creates multiple chunks for an entity.
+// All chunks are written with a single INSERT instead of one CREATE per chunk.
 func (c *Client) CreateChunks(ctx context.Context, entityID string, chunks []models.ChunkInput) error {
 	if len(chunks) == 0 {
 		return nil
 	}
 	c.startOp() // Mark activity for heartbeat
 
-	for _, chunk := range chunks {
-		sql := `
-			CREATE chunk SET
-				entity = type::record("entity", $entity_id),
-				content = $content,
-				position = $position,
-				heading_path = $heading_path,
-				labels = $labels,
-				embedding = $embedding
-		`
+	rows := make([]map[string]any, len(chunks))
+	for i, chunk := range chunks {
 		labels := chunk.Labels
 		if labels == nil {
 			labels = []string{}
 		}
-		_, err := surrealdb.Query[any](ctx, c.db, sql, map[string]any{
-			"entity_id":    entityID,
+		rows[i] = map[string]any{
 			"content":      chunk.Content,
 			"position":     chunk.Position,
 			"heading_path": optionalString(chunk.HeadingPath),
 			"labels":       labels,
 			"embedding":    optionalEmbedding(chunk.Embedding),
-		})
-		if err != nil {
-			return fmt.Errorf("create chunk %d: %w", chunk.Position, err)
 		}
 	}
 
+	sql := `
+		LET $rows = $chunks.map(|$c| object::extend($c, { entity: $entity }));
+		INSERT INTO chunk $rows RETURN NONE;
+	`
+	_, err := surrealdb.Query[any](ctx, c.db, sql, map[string]any{
+		"entity": entityRecordID(entityID),
+		"chunks": rows,
+	})
+	if err != nil {
+		return fmt.Errorf("create chunks: %w", err)
+	}
+
 	return nil
 }
 
 // DeleteChunks deletes all chunks for an entity.
 func (c *Client) DeleteChunks(ctx context.Context, entityID string) error {
 	_, err := surrealdb.Query[any](ctx, c.db, `
-		DELETE chunk WHERE entity = type::record("entity", $entity_id)
-	`, map[string]any{"entity_id": entityID})
+		DELETE chunk WHERE entity = $entity RETURN NONE
+	`, map[string]any{"entity": entityRecordID(entityID)})
 	if err != nil {
 		return fmt.Errorf("delete chunks: %w", err)
 	}
@@ -614,10 +699,10 @@ func (c *Client) DeleteChunks(ctx context.Context, entityID string) error {
 // GetChunks retrieves all chunks for an entity, ordered by position.
 func (c *Client) GetChunks(ctx context.Context, entityID string) ([]models.Chunk, error) {
 	results, err := surrealdb.Query[[]models.Chunk](ctx, c.db, `
-		SELECT * FROM chunk
-		WHERE entity = type::record("entity", $entity_id)
+		SELECT * OMIT embedding FROM chunk
+		WHERE entity = $entity
 		ORDER BY position ASC
-	`, map[string]any{"entity_id": entityID})
+	`, map[string]any{"entity": entityRecordID(entityID)})
 
 	if err != nil {
 		return nil, fmt.Errorf("get chunks: %w", err)
@@ -637,54 +722,101 @@ func (c *Client) GetChunks(ctx context.Context, entityID string) ([]models.Chunk
 // If a relation of the same type already exists, updates its strength.
 func (c *Client) CreateRelation(ctx context.Context, input models.RelationInput) error {
 	c.startOp() // Mark activity for heartbeat
-	strength := 1.0
-	if input.Strength != nil {
-		strength = *input.Strength
+	if err := c.upsertRelations(ctx, []models.RelationInput{input}); err != nil {
+		return fmt.Errorf("create relation: %w", err)
 	}
-	source := "manual"
-	if input.Source != nil {
-		source = *input.Source
+	return nil
+}
+
+// CreateRelations creates or updates several relations in a single query.
+// Each relation follows the same upsert-by-unique_key rules as CreateRelation.
+//
+// The batch runs as one statement, so a single failing relation (e.g. a
+// concurrent writer winning the unique_key race) rolls back all of them. In
+// that case each relation is retried on its own; failures are logged and
+// returned joined, and the remaining relations are still written.
+func (c *Client) CreateRelations(ctx context.Context, inputs []models.RelationInput) error {
+	if len(inputs) == 0 {
+		return nil
+	}
+	c.startOp() // Mark activity for heartbeat
+
+	batchErr := c.upsertRelations(ctx, inputs)
+	if batchErr == nil {
+		return nil
+	}
+	if len(inputs) == 1 {
+		return fmt.Errorf("create relations: %w", batchErr)
+	}
+
+	c.logger.Debug("batch relation upsert failed, retrying individually", "count", len(inputs), "error", batchErr)
+	var errs []error
+	for _, input := range inputs {
+		if err := c.upsertRelations(ctx, []models.RelationInput{input}); err != nil {
+			c.logger.Warn("failed to create relation", "from", input.FromID, "to", input.ToID, "rel_type", input.RelType, "error", err)
+			errs = append(errs, fmt.Errorf("%s -[%s]-> %s: %w", input.FromID, input.RelType, input.ToID, err))
+		}
+	}
+	if len(errs) > 0 {
+		return fmt.Errorf("create relations: %d of %d failed: %w", len(errs), len(inputs), errors.Join(errs...))
+	}
+	return nil
+}
+
+// upsertRelations writes relations in one FOR statement, upserting by unique_key.
+func (c *Client) upsertRelations(ctx context.Context, inputs []models.RelationInput) error {
+	rels := make([]map[string]any, len(inputs))
+	for i, input := range inputs {
+		strength := 1.0
+		if input.Strength != nil {
+			strength = *input.Strength
+		}
+		source := "manual"
+		if input.Source != nil {
+			source = *input.Source
+		}
+		rels[i] = map[string]any{
+			"from":     entityRecordID(input.FromID),
+			"to":       entityRecordID(input.ToID),
+			"rel_type": input.RelType,
+			"strength": strength,
+			"source":   source,
+			"metadata": optionalObject(input.Metadata),
+		}
 	}
 
 	// Use UPSERT pattern based on unique_key
 	sql := `
-		LET $from_rec = type::record("entity", $from_id);
-		LET $to_rec = type::record("entity", $to_id);
-		LET $sorted = array::sort([<string>$from_rec, <string>$to_rec]);
-		LET $unique = string::concat($sorted, $rel_type);
-		LET $existing = (SELECT * FROM relates_to WHERE unique_key = $unique);
-		IF array::len($existing) > 0 THEN
-			UPDATE $existing[0].id SET strength = $strength, metadata = $metadata
-		ELSE
-			RELATE $from_rec->relates_to->$to_rec SET
-				rel_type = $rel_type,
-				strength = $strength,
-				source = $source,
-				metadata = $metadata
-		END
+		FOR $rel IN $rels {
+			LET $from_rec = $rel.from;
+			LET $to_rec = $rel.to;
+			LET $sorted = array::sort([<string>$from_rec, <string>$to_rec]);
+			LET $unique = string::concat($sorted, $rel.rel_type);
+			LET $existing = (SELECT * FROM relates_to WHERE unique_key = $unique);
+			IF array::len($existing) > 0 {
+				UPDATE $existing[0].id SET strength = $rel.strength, metadata = $rel.metadata RETURN NONE;
+			} ELSE {
+				RELATE $from_rec->relates_to->$to_rec SET
+					rel_type = $rel.rel_type,
+					strength = $rel.strength,
+					source = $rel.source,
+					metadata = $rel.metadata
+				RETURN NONE;
+			};
+		};
 	`
 
-	_, err := surrealdb.Query[any](ctx, c.db, sql, map[string]any{
-		"from_id":  input.FromID,
-		"to_id":    input.ToID,
-		"rel_type": input.RelType,
-		"strength": strength,
-		"source":   source,
-		"metadata": optionalObject(input.Metadata),
-	})
-	if err != nil {
-		return fmt.Errorf("create relation: %w", err)
-	}
-	return nil
+	_, err := surrealdb.Query[any](ctx, c.db, sql, map[string]any{"rels": rels})
+	return err
 }
 
 // GetRelations retrieves all relations for an entity (both directions).
 func (c *Client) GetRelations(ctx context.Context, entityID string) ([]models.Relation, error) {
 	sql := `
 		SELECT * FROM relates_to
-		WHERE in = type::record("entity", $id) OR out = type::record("entity", $id)
+		WHERE in = $id OR out = $id
 	`
-	results, err := surrealdb.Query[[]models.Relation](ctx, c.db, sql, map[string]any{"id": entityID})
+	results, err := surrealdb.Query[[]models.Relation](ctx, c.db, sql, map[string]any{"id": entityRecordID(entityID)})
 	if err != nil {
 		return nil, fmt.Errorf("get relations: %w", err)
 	}
@@ -699,13 +831,12 @@ func (c *Client) GetRelations(ctx context.Context, entityID string) ([]models.Re
 func (c *Client) DeleteRelation(ctx context.Context, fromID, toID, relType string) error {
 	sql := `
 		DELETE relates_to WHERE
-			(in = type::record("entity", $from_id) AND out = type::record("entity", $to_id) AND rel_type = $rel_type)
-			OR
-			(in = type::record("entity", $to_id) AND out = type::record("entity", $from_id) AND rel_type = $rel_type)
+			rel_type = $rel_type AND ((in = $from AND out = $to) OR (in = $to AND out = $from))
+		RETURN NONE
 	`
 	_, err := surrealdb.Query[any](ctx, c.db, sql, map[string]any{
-		"from_id":  fromID,
-		"to_id":    toID,
+		"from":     entityRecordID(fromID),
+		"to":       entityRecordID(toID),
 		"rel_type": relType,
 	})
 	if err != nil {
@@ -811,6 +942,7 @@ func (c *Client) RecordTokenUsage(ctx context.Context, input models.TokenUsageIn
 			total_tokens = $total_tokens,
 			cost_usd = $cost_usd,
 			entity_id = $entity_id
+		RETURN NONE
 	`
 
 	_, err := surrealdb.Query[any](ctx, c.db, sql, map[string]any{
@@ -829,18 +961,25 @@ func (c *Client) RecordTokenUsage(ctx context.Context, input models.TokenUsageIn
 }
 
 // GetTokenUsageSummary returns aggregated token usage statistics.
-// Uses separate simple queries instead of complex multi-statement query for better
-// concurrency behavior with the WebSocket connection.
+// Runs a single query for the usage rows since the given time and sums the
+// totals and the per-operation and per-model breakdowns in Go.
 func (c *Client) GetTokenUsageSummary(ctx context.Context, since string) (*models.TokenUsageSummary, error) {
 	c.startOp() // Mark activity for heartbeat
 
 	vars := map[string]any{"since": since}
 
-	// Query 1: Get all usage records and sum client-side (simpler than complex GROUP ALL)
-	usageSQL := `SELECT total_tokens, cost_usd FROM token_usage WHERE created_at >= <datetime>$since`
+	// One scan of the usage rows in the window; totals and both breakdowns are
+	// summed client-side instead of issuing a separate GROUP BY per breakdown.
+	usageSQL := `
+		SELECT total_tokens, cost_usd, operation, model
+		FROM token_usage
+		WHERE created_at >= <datetime>$since
+	`
 	type usageRow struct {
 		TotalTokens int      `json:"total_tokens"`
 		CostUSD     *float64 `json:"cost_usd"`
+		Operation   string   `json:"operation"`
+		Model       string   `json:"model"`
 	}
 	usageResults, err := surrealdb.Query[[]usageRow](ctx, c.db, usageSQL, vars)
 	if err != nil {
@@ -858,48 +997,8 @@ func (c *Client) GetTokenUsageSummary(ctx context.Context, since string) (*model
 			if row.CostUSD != nil {
 				summary.TotalCostUSD += *row.CostUSD
 			}
-		}
-	}
-
-	// Query 2: Group by operation (math::sum returns float in SurrealDB v3)
-	byOpSQL := `
-		SELECT operation, math::sum(total_tokens) AS tokens
-		FROM token_usage
-		WHERE created_at >= <datetime>$since
-		GROUP BY operation
-	`
-	type opResult struct {
-		Operation string  `json:"operation"`
-		Tokens    float64 `json:"tokens"`
-	}
-	opResults, err := surrealdb.Query[[]opResult](ctx, c.db, byOpSQL, vars)
-	if err != nil {
-		return nil, fmt.Errorf("get tokens by operation: %w", err)
-	}
-	if opResults != nil && len(*opResults) > 0 {
-		for _, r := range (*opResults)[len(*opResults)-1].Result {
-			summary.ByOperation[r.Operation] = int(r.Tokens)
-		}
-	}
-
-	// Query 3: Group by model (math::sum returns float in SurrealDB v3)
-	byModelSQL := `
-		SELECT model, math::sum(total_tokens) AS tokens
-		FROM token_usage
-		WHERE created_at >= <datetime>$since
-		GROUP BY model
-	`
-	type modelResult struct {
-		Model  string  `json:"model"`
-		Tokens float64 `json:"tokens"`
-	}
-	modelResults, err := surrealdb.Query[[]modelResult](ctx, c.db, byModelSQL, vars)
-	if err != nil {
-		return nil, fmt.Errorf("get tokens by model: %w", err)
-	}
-	if modelResults != nil && len(*modelResults) > 0 {
-		for _, r := range (*modelResults)[len(*modelResults)-1].Result {
-			summary.ByModel[r.Model] = int(r.Tokens)
+			summary.ByOperation[row.Operation] += row.TotalTokens
+			summary.ByModel[row.Model] += row.TotalTokens
 		}
 	}
 
@@ -924,14 +1023,16 @@ type TypeCount struct {
 
 // ListLabels returns unique labels with entity counts.
 func (c *Client) ListLabels(ctx context.Context) ([]LabelCount, error) {
+	// SPLIT yields one row per (entity, label) so the server can group and
+	// count in a single pass instead of re-filtering the flattened list per label.
+	// SPLIT runs after the projection, so it must be applied in a subquery
+	// before grouping.
 	sql := `
-		LET $all_labels = (SELECT labels FROM entity);
-		LET $flattened = array::flatten($all_labels.labels);
-		LET $unique = array::distinct($flattened);
-		RETURN $unique.map(|$label| {
-			label: $label,
-			count: $flattened.filter(|$l| $l == $label).len()
-		}).sort(|$a, $b| IF $a.count > $b.count THEN -1 ELSE IF $a.count < $b.count THEN 1 ELSE 0 END)
+		SELECT label, count() AS count FROM (
+			SELECT labels AS label FROM entity SPLIT label
+		)
+		GROUP BY label
+		ORDER BY count DESC
 	`
 
 	results, err := surrealdb.Query[[]LabelCount](ctx, c.db, sql, nil)
@@ -942,8 +1043,7 @@ func (c *Client) ListLabels(ctx context.Context) ([]LabelCount, error) {
 	if results == nil || len(*results) == 0 {
 		return []LabelCount{}, nil
 	}
-	lastIdx := len(*results) - 1
-	return (*results)[lastIdx].Result, nil
+	return (*results)[0].Result, nil
 }
 
 // ListTypes returns entity types with counts.
@@ -987,7 +1087,7 @@ func (c *Client) ListEntities(ctx context.Context, entityType string, labels []s
 	}
 
 	sql := fmt.Sprintf(`
-		SELECT * FROM entity %s ORDER BY updated_at DESC LIMIT $limit
+		SELECT * OMIT embedding FROM entity %s ORDER BY updated_at DESC LIMIT $limit
 	`, whereClause)
 
 	results, err := surrealdb.Query[[]models.Entity](ctx, c.db, sql, vars)
@@ -1001,6 +1101,27 @@ func (c *Client) ListEntities(ctx context.Context, entityType string, labels []s
 	return (*results)[0].Result, nil
 }
 
+// ListEntityNames returns the names of the most recently updated entities.
+// Only the name column is fetched, so callers that need names as context
+// don't pull full records (including embeddings) over the wire.
+func (c *Client) ListEntityNames(ctx context.Context, limit int) ([]string, error) {
+	if limit <= 0 {
+		limit = 50
+	}
+
+	results, err := surrealdb.Query[[]string](ctx, c.db, `
+		SELECT VALUE name FROM entity ORDER BY updated_at DESC LIMIT $limit
+	`, map[string]any{"limit": limit})
+	if err != nil {
+		return nil, fmt.Errorf("list entity names: %w", err)
+	}
+
+	if results == nil || len(*results) == 0 {
+		return []string{}, nil
+	}
+	return (*results)[0].Result, nil
+}
+
 // =============================================================================
 // INGEST JOB QUERIES
 // =============================================================================
@@ -1038,6 +1159,7 @@ func (c *Client) CreateIngestJob(ctx context.Context, id, name, dirPath string,
 				options = $options,
 				total = $total,
 				progress = 0
+			RETURN NONE
 		`
 		params["name"] = name
 	} else {
@@ -1051,6 +1173,7 @@ func (c *Client) CreateIngestJob(ctx context.Context, id, name, dirPath string,
 				options = $options,
 				total = $total,
 				progress = 0
+			RETURN NONE
 		`
 	}
 
@@ -1113,7 +1236,7 @@ func (c *Client) GetIncompleteJobs(ctx context.Context) ([]models.IngestJob, err
 func (c *Client) UpdateJobStatus(ctx context.Context, id, status string) error {
 	c.startOp() // Mark activity for heartbeat
 	_, err := surrealdb.Query[any](ctx, c.db, `
-		UPDATE type::record("ingest_job", $id) SET status = $status
+		UPDATE type::record("ingest_job", $id) SET status = $status RETURN NONE
 	`, map[string]any{"id": id, "status": status})
 	if err != nil {
 		return fmt.Errorf("update job status: %w", err)
@@ -1125,7 +1248,7 @@ func (c *Client) UpdateJobStatus(ctx context.Context, id, status string) error {
 func (c *Client) UpdateJobProgress(ctx context.Context, id string, progress int) error {
 	c.startOp() // Mark activity for heartbeat
 	_, err := surrealdb.Query[any](ctx, c.db, `
-		UPDATE type::record("ingest_job", $id) SET progress = $progress
+		UPDATE type::record("ingest_job", $id) SET progress = $progress RETURN NONE
 	`, map[string]any{"id": id, "progress": progress})
 	if err != nil {
 		return fmt.Errorf("update job progress: %w", err)
@@ -1141,6 +1264,7 @@ func (c *Client) CompleteJob(ctx context.Context, id string, result map[string]a
 			status = "completed",
 			result = $result,
 			completed_at = time::now()
+		RETURN NONE
 	`, map[string]any{"id": id, "result": result})
 	if err != nil {
 		return fmt.Errorf("complete job: %w", err)
@@ -1156,6 +1280,7 @@ func (c *Client) FailJob(ctx context.Context, id string, errMsg string) error {
 			status = "failed",
 			error = $error,
 			completed_at = time::now()
+		RETURN NONE
 	`, map[string]any{"id": id, "error": errMsg})
 	if err != nil {
 		return fmt.Errorf("fail job: %w", err)
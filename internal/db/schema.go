@@ -206,5 +206,11 @@ func SchemaSQL(dimension int) string {
     WHEN $event = "DELETE" THEN {
         DELETE FROM message WHERE conversation = $before.id
     };
+
+    -- ==========================================================================
+    -- SCHEMA_META TABLE (Applied Schema Version)
+    -- ==========================================================================
+    -- Holds a hash of the last applied schema so startup can skip unchanged DDL.
+    DEFINE TABLE IF NOT EXISTS schema_meta SCHEMALESS;
 `, dimension, dimension)
 }
@@ -0,0 +1,66 @@
+package graph
+
+import (
+	"sync"
+	"time"
+)
+
+// aggregateCacheTTL bounds how stale the label and type counts may be.
+// They are full-table aggregates that the UI requests on every page load,
+// while the underlying data changes far less often. Writes made through the
+// API reset the caches; background ingest jobs rely on the TTL.
+const aggregateCacheTTL = 10 * time.Second
+
+// ttlCache memoizes a single value for a fixed duration.
+// The lock is not held while loading, so a slow query never blocks other
+// callers beyond their own request.
+type ttlCache[T any] struct {
+	mu      sync.Mutex
+	value   T
+	expires time.Time
+	gen     uint64 // bumped by reset so in-flight loads don't store stale values
+}
+
+// get returns the cached value, calling load to refresh it once it expired.
+// Errors are not cached.
+func (c *ttlCache[T]) get(ttl time.Duration, load func() (T, error)) (T, error) {
+	c.mu.Lock()
+	if time.Now().Before(c.expires) {
+		v := c.value
+		c.mu.Unlock()
+		return v, nil
+	}
+	gen := c.gen
+	c.mu.Unlock()
+
+	v, err := load()
+	if err != nil {
+		var zero T
+		return zero, err
+	}
+
+	c.mu.Lock()
+	if c.gen == gen {
+		c.value = v
+		c.expires = time.Now().Add(ttl)
+	}
+	c.mu.Unlock()
+	return v, nil
+}
+
+// reset drops the cached value so the next get loads it again.
+func (c *ttlCache[T]) reset() {
+	c.mu.Lock()
+	defer c.mu.Unlock()
+
+	var zero T
+	c.value = zero
+	c.expires = time.Time{}
+	c.gen++
+}
+
+// invalidateAggregates resets the label and type count caches after a write.
+func (r *Resolver) invalidateAggregates() {
+	r.labelsCache.reset()
+	r.typesCache.reset()
+}
@@ -0,0 +1,40 @@
+package graph
+
+import (
+	"testing"
+	"time"
+)
+
+func TestTTLCache(t *testing.T) {
+	var c ttlCache[int]
+	loads := 0
+	load := func() (int, error) {
+		loads++
+		return loads, nil
+	}
+
+	if v, _ := c.get(time.Minute, load); v != 1 {
+		t.Errorf("Expected first load to return 1, got %d", v)
+	}
+	if v, _ := c.get(time.Minute, load); v != 1 || loads != 1 {
+		t.Errorf("Expected cached value 1 after 1 load, got %d after %d loads", v, loads)
+	}
+
+	c.reset()
+	if v, _ := c.get(time.Minute, load); v != 2 {
+		t.Errorf("Expected reload after reset to return 2, got %d", v)
+	}
+
+	// A load that started before a reset must not repopulate the cache
+	c.reset()
+	_, err := c.get(time.Minute, func() (int, error) {
+		c.reset()
+		return 100, nil
+	})
+	if err != nil {
+		t.Fatalf("get failed: %v", err)
+	}
+	if v, _ := c.get(time.Minute, load); v != 3 {
+		t.Errorf("Expected stale load to be discarded and 3 loaded, got %d", v)
+	}
+}
@@ -8600,7 +8600,7 @@ func (ec *executionContext) unmarshalInputIngestInput(ctx context.Context, obj a
 		asMap[k] = v
 	}
 
-	fieldsInOrder := [...]string{"name", "labels", "extractGraph", "dryRun", "recursive"}
+	fieldsInOrder := [...]string{"name", "labels", "extractGraph", "dryRun", "recursive", "skipUnchanged"}
 	for _, k := range fieldsInOrder {
 		v, ok := asMap[k]
 		if !ok {
@@ -8642,6 +8642,13 @@ func (ec *executionContext) unmarshalInputIngestInput(ctx context.Context, obj a
 				return it, err
 			}
 			it.Recursive = data
+		case "skipUnchanged":
+			ctx := graphql.WithPathContext(ctx, graphql.NewPathWithField("skipUnchanged"))
+			data, err := ec.unmarshalOBoolean2ᚖbool(ctx, v)
+			if err != nil {
+				return it, err
+			}
+			it.SkipUnchanged = data
 		}
 	}
 
@@ -2,13 +2,39 @@
 package graph
 
 import (
+	"context"
 	"fmt"
 
+	"github.com/99designs/gqlgen/graphql"
 	"github.com/raphaelgruber/memcp-go/internal/metrics"
 	"github.com/raphaelgruber/memcp-go/internal/models"
 	"github.com/raphaelgruber/memcp-go/internal/service"
 )
 
+// ingestSkipUnchanged resolves the skipUnchanged ingest option. Unless set
+// explicitly, unchanged files are only skipped when the run adds no labels and
+// doesn't extract the graph, since those should still reach stored files.
+func ingestSkipUnchanged(input *IngestInput) bool {
+	if input == nil {
+		return true
+	}
+	if input.SkipUnchanged != nil {
+		return *input.SkipUnchanged
+	}
+	return len(input.Labels) == 0 && (input.ExtractGraph == nil || !*input.ExtractGraph)
+}
+
+// entityFieldRequested reports whether the query selects the named field on
+// the Entity returned by the current resolver.
+func entityFieldRequested(ctx context.Context, name string) bool {
+	for _, f := range graphql.CollectFieldsCtx(ctx, []string{"Entity"}) {
+		if f.Name == name {
+			return true
+		}
+	}
+	return false
+}
+
 // entityToGraphQL converts a models.Entity to a GraphQL Entity.
 func entityToGraphQL(e *models.Entity) *Entity {
 	if e == nil {
@@ -37,8 +63,38 @@ func entityToGraphQL(e *models.Entity) *Entity {
 		UpdatedAt:   e.UpdatedAt,
 		AccessedAt:  e.Accessed,
 		AccessCount: e.AccessCount,
-		Relations:   []Relation{}, // Relations loaded separately if needed
+		Relations:   relationsToGraphQL(e.Relations),
+	}
+}
+
+// relationsToGraphQL converts models.Relations to GraphQL Relations.
+// Entities loaded without relations map to an empty list.
+func relationsToGraphQL(rels []models.Relation) []Relation {
+	result := make([]Relation, len(rels))
+	for i, r := range rels {
+		idStr, err := models.RecordIDString(r.ID)
+		if err != nil {
+			idStr = fmt.Sprintf("%v", r.ID.ID)
+		}
+		fromID, err := models.RecordIDString(r.In)
+		if err != nil {
+			fromID = fmt.Sprintf("%v", r.In.ID)
+		}
+		toID, err := models.RecordIDString(r.Out)
+		if err != nil {
+			toID = fmt.Sprintf("%v", r.Out.ID)
+		}
+		result[i] = Relation{
+			ID:        idStr,
+			FromID:    fromID,
+			ToID:      toID,
+			RelType:   r.RelType,
+			Strength:  r.Strength,
+			Source:    r.Source,
+			CreatedAt: r.CreatedAt,
+		}
 	}
+	return result
 }
 
 // templateToGraphQL converts a models.Template to a GraphQL Template.
@@ -164,6 +220,7 @@ func dbJobToGraphQL(j *models.IngestJob) *Job {
 	if j.Result != nil {
 		result = &IngestResult{
 			FilesProcessed:   intFromMap(j.Result, "files_processed"),
+			FilesSkipped:     intFromMap(j.Result, "files_skipped"),
 			EntitiesCreated:  intFromMap(j.Result, "entities_created"),
 			ChunksCreated:    intFromMap(j.Result, "chunks_created"),
 			RelationsCreated: intFromMap(j.Result, "relations_created"),
@@ -166,4 +166,6 @@ type IngestInput struct {
 	ExtractGraph *bool    `json:"extractGraph,omitempty"`
 	DryRun       *bool    `json:"dryRun,omitempty"`
 	Recursive    *bool    `json:"recursive,omitempty"`
+	// Skip files whose entity already stores the same content hash (directory ingestion only)
+	SkipUnchanged *bool `json:"skipUnchanged,omitempty"`
 }
@@ -23,6 +23,9 @@ type Resolver struct {
 	jobManager    *service.JobManager
 	cfg           config.Config
 	metrics       *metrics.Collector
+
+	labelsCache ttlCache[[]*LabelCount]
+	typesCache  ttlCache[[]*TypeCount]
 }
 
 // NewResolver creates a new resolver with all dependencies.
@@ -109,5 +112,9 @@ func (r *Resolver) Close(ctx context.Context) error {
 
 // WipeData deletes all data from the database. Use for testing only.
 func (r *Resolver) WipeData(ctx context.Context) error {
-	return r.db.WipeData(ctx)
+	if err := r.db.WipeData(ctx); err != nil {
+		return err
+	}
+	r.invalidateAggregates()
+	return nil
 }
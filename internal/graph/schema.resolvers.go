@@ -11,6 +11,7 @@ import (
 	"log/slog"
 	"path/filepath"
 	"strings"
+	"sync"
 	"time"
 
 	"github.com/raphaelgruber/memcp-go/internal/llm"
@@ -42,6 +43,7 @@ func (r *mutationResolver) CreateEntity(ctx context.Context, input EntityInput)
 	if err != nil {
 		return nil, err
 	}
+	r.invalidateAggregates()
 
 	return entityToGraphQL(result.Entity), nil
 }
@@ -63,13 +65,19 @@ func (r *mutationResolver) UpdateEntity(ctx context.Context, id string, input En
 	if err != nil {
 		return nil, err
 	}
+	r.invalidateAggregates()
 
 	return entityToGraphQL(entity), nil
 }
 
 // DeleteEntity is the resolver for the deleteEntity field.
 func (r *mutationResolver) DeleteEntity(ctx context.Context, id string) (bool, error) {
-	return r.entityService.Delete(ctx, id)
+	deleted, err := r.entityService.Delete(ctx, id)
+	if err != nil {
+		return false, err
+	}
+	r.invalidateAggregates()
+	return deleted, nil
 }
 
 // CreateRelation is the resolver for the createRelation field.
@@ -111,6 +119,7 @@ func (r *mutationResolver) IngestFile(ctx context.Context, filePath string, inpu
 	if err != nil {
 		return nil, err
 	}
+	r.invalidateAggregates()
 
 	return entityToGraphQL(result.Entity), nil
 }
@@ -132,11 +141,13 @@ func (r *mutationResolver) IngestDirectory(ctx context.Context, dirPath string,
 			opts.Recursive = *input.Recursive
 		}
 	}
+	opts.SkipUnchanged = ingestSkipUnchanged(input)
 
 	result, err := r.ingestService.IngestDirectory(ctx, dirPath, opts)
 	if err != nil {
 		return nil, err
 	}
+	r.invalidateAggregates()
 
 	return &IngestResult{
 		FilesProcessed:   result.FilesProcessed,
@@ -166,6 +177,7 @@ func (r *mutationResolver) IngestDirectoryAsync(ctx context.Context, dirPath str
 			opts.Recursive = *input.Recursive
 		}
 	}
+	opts.SkipUnchanged = ingestSkipUnchanged(input)
 
 	job, err := r.ingestService.IngestDirectoryAsync(ctx, r.jobManager, dirPath, opts)
 	if err != nil {
@@ -225,6 +237,7 @@ func (r *mutationResolver) IngestFiles(ctx context.Context, input IngestFilesInp
 	if err != nil {
 		return nil, err
 	}
+	r.invalidateAggregates()
 
 	return &IngestResult{
 		FilesProcessed:   result.FilesProcessed,
@@ -301,7 +314,7 @@ func (r *mutationResolver) DeleteConversation(ctx context.Context, id string) (b
 
 // Entity is the resolver for the entity field.
 func (r *queryResolver) Entity(ctx context.Context, id string) (*Entity, error) {
-	entity, err := r.entityService.Get(ctx, id)
+	entity, err := r.entityService.Get(ctx, id, entityFieldRequested(ctx, "relations"))
 	if err != nil {
 		return nil, err
 	}
@@ -313,23 +326,13 @@ func (r *queryResolver) Entity(ctx context.Context, id string) (*Entity, error)
 
 // EntityByName is the resolver for the entityByName field.
 func (r *queryResolver) EntityByName(ctx context.Context, name string) (*Entity, error) {
-	entity, err := r.db.GetEntityByName(ctx, name)
+	entity, err := r.db.AccessEntityByName(ctx, name, entityFieldRequested(ctx, "relations"))
 	if err != nil {
 		return nil, err
 	}
 	if entity == nil {
 		return nil, nil
 	}
-
-	// Update access tracking (best-effort)
-	if idStr, err := models.RecordIDString(entity.ID); err == nil {
-		if err := r.db.UpdateEntityAccess(ctx, idStr); err != nil {
-			slog.Warn("failed to update entity access", "entity", idStr, "error", err)
-		}
-	} else {
-		slog.Warn("failed to extract entity ID for access tracking", "error", err)
-	}
-
 	return entityToGraphQL(entity), nil
 }
 
@@ -407,36 +410,40 @@ func (r *queryResolver) Ask(ctx context.Context, query string, input *SearchInpu
 
 // Labels is the resolver for the labels field.
 func (r *queryResolver) Labels(ctx context.Context) ([]*LabelCount, error) {
-	labels, err := r.db.ListLabels(ctx)
-	if err != nil {
-		return nil, err
-	}
+	return r.labelsCache.get(aggregateCacheTTL, func() ([]*LabelCount, error) {
+		labels, err := r.db.ListLabels(ctx)
+		if err != nil {
+			return nil, err
+		}
 
-	result := make([]*LabelCount, len(labels))
-	for i := range labels {
-		result[i] = &LabelCount{
-			Label: labels[i].Label,
-			Count: labels[i].Count,
+		result := make([]*LabelCount, len(labels))
+		for i := range labels {
+			result[i] = &LabelCount{
+				Label: labels[i].Label,
+				Count: labels[i].Count,
+			}
 		}
-	}
-	return result, nil
+		return result, nil
+	})
 }
 
 // Types is the resolver for the types field.
 func (r *queryResolver) Types(ctx context.Context) ([]*TypeCount, error) {
-	types, err := r.db.ListTypes(ctx)
-	if err != nil {
-		return nil, err
-	}
+	return r.typesCache.get(aggregateCacheTTL, func() ([]*TypeCount, error) {
+		types, err := r.db.ListTypes(ctx)
+		if err != nil {
+			return nil, err
+		}
 
-	result := make([]*TypeCount, len(types))
-	for i := range types {
-		result[i] = &TypeCount{
-			Type:  types[i].Type,
-			Count: types[i].Count,
+		result := make([]*TypeCount, len(types))
+		for i := range types {
+			result[i] = &TypeCount{
+				Type:  types[i].Type,
+				Count: types[i].Count,
+			}
 		}
-	}
-	return result, nil
+		return result, nil
+	})
 }
 
 // Template is the resolver for the template field.
@@ -582,17 +589,26 @@ func (r *queryResolver) Conversations(ctx context.Context, limit *int) ([]*Conve
 
 // Conversation is the resolver for the conversation field.
 func (r *queryResolver) Conversation(ctx context.Context, id string) (*Conversation, error) {
+	// Messages only depend on the ID, so fetch them alongside the conversation
+	var msgs []models.Message
+	var msgsErr error
+	var wg sync.WaitGroup
+	wg.Add(1)
+	go func() {
+		defer wg.Done()
+		msgs, msgsErr = r.db.GetMessages(ctx, id)
+	}()
+
 	conv, err := r.db.GetConversation(ctx, id)
+	wg.Wait()
 	if err != nil {
 		return nil, err
 	}
 	if conv == nil {
 		return nil, nil
 	}
-
-	msgs, err := r.db.GetMessages(ctx, id)
-	if err != nil {
-		return nil, err
+	if msgsErr != nil {
+		return nil, msgsErr
 	}
 
 	gqlMsgs := make([]Message, len(msgs))
@@ -2,14 +2,18 @@
 package llm
 
 import (
+	"cmp"
 	"context"
+	"crypto/sha256"
 	"fmt"
 	"log/slog"
+	"slices"
 	"strings"
 	"time"
 
 	awsconfig "github.com/aws/aws-sdk-go-v2/config"
 	"github.com/aws/aws-sdk-go-v2/service/bedrockruntime"
+	lru "github.com/hashicorp/golang-lru/v2"
 	"github.com/raphaelgruber/memcp-go/internal/config"
 	"github.com/raphaelgruber/memcp-go/internal/metrics"
 	"github.com/tmc/langchaingo/embeddings"
@@ -24,6 +28,12 @@ type Embedder struct {
 	dimension int
 	modelName string
 	metrics   *metrics.Collector
+
+	// cache holds recent embeddings keyed by a hash of the input text, so
+	// repeated texts skip the provider round-trip without the cache retaining
+	// full document contents. Nil when caching is disabled.
+	// Cached vectors are shared between callers and must not be modified.
+	cache *lru.Cache[embedCacheKey, []float32]
 }
 
 // NewEmbedder creates an embedder based on configuration.
@@ -74,17 +84,38 @@ func NewEmbedder(ctx context.Context, cfg config.Config, mc *metrics.Collector)
 		return nil, fmt.Errorf("unsupported embedding provider: %s", cfg.EmbedProvider)
 	}
 
+	var cache *lru.Cache[embedCacheKey, []float32]
+	if cfg.EmbedCacheSize > 0 {
+		cache, err = lru.New[embedCacheKey, []float32](cfg.EmbedCacheSize)
+		if err != nil {
+			return nil, fmt.Errorf("create embedding cache: %w", err)
+		}
+	}
+
 	return &Embedder{
 		model:     model,
 		dimension: cfg.EmbedDimension,
 		modelName: cfg.EmbedModel,
 		metrics:   mc,
+		cache:     cache,
 	}, nil
 }
 
+// embedCacheKey is the SHA-256 digest of an embedded text.
+type embedCacheKey [sha256.Size]byte
+
 // Embed generates an embedding vector for text.
+// Results are served from the LRU cache when the same text was embedded recently.
 func (e *Embedder) Embed(ctx context.Context, text string) ([]float32, error) {
 	textLen := len(text)
+	var key embedCacheKey
+	if e.cache != nil {
+		key = sha256.Sum256([]byte(text))
+		if embedding, ok := e.cache.Get(key); ok {
+			slog.Debug("embedding cache hit", "model", e.modelName, "text_len", textLen)
+			return embedding, nil
+		}
+	}
 	slog.Debug("embedding text", "model", e.modelName, "text_len", textLen)
 
 	start := time.Now()
@@ -111,31 +142,69 @@ func (e *Embedder) Embed(ctx context.Context, text string) ([]float32, error) {
 		e.metrics.RecordTiming(metrics.OpEmbedding, duration)
 	}
 
+	if e.cache != nil {
+		e.cache.Add(key, embedding)
+	}
+
 	return embedding, nil
 }
 
 // EmbedBatch generates embeddings for multiple texts.
+// Texts already in the cache are not sent to the provider again; only the
+// misses are embedded (in one call, sorted by length) and then cached.
 func (e *Embedder) EmbedBatch(ctx context.Context, texts []string) ([][]float32, error) {
 	if len(texts) == 0 {
 		return [][]float32{}, nil
 	}
 
+	vectors := make([][]float32, len(texts))
+	missing := make([]int, 0, len(texts))
+	var keys []embedCacheKey
+	if e.cache != nil {
+		keys = make([]embedCacheKey, len(texts))
+	}
+	for i, text := range texts {
+		if e.cache != nil {
+			keys[i] = sha256.Sum256([]byte(text))
+			if embedding, ok := e.cache.Get(keys[i]); ok {
+				vectors[i] = embedding
+				continue
+			}
+		}
+		missing = append(missing, i)
+	}
+	if len(missing) == 0 {
+		slog.Debug("embedding batch served from cache", "model", e.modelName, "count", len(texts))
+		return vectors, nil
+	}
+
+	// Send texts ordered by length so provider-side sub-batches group
+	// similarly sized inputs and waste less padding. Results are scattered
+	// back through missing, so the caller's order is preserved.
+	slices.SortStableFunc(missing, func(a, b int) int {
+		return cmp.Compare(len(texts[a]), len(texts[b]))
+	})
+	batch := make([]string, len(missing))
+	for j, i := range missing {
+		batch[j] = texts[i]
+	}
+
 	start := time.Now()
-	vectors, err := e.model.EmbedDocuments(ctx, texts)
+	embedded, err := e.model.EmbedDocuments(ctx, batch)
 	duration := time.Since(start)
 
 	if err != nil {
 		return nil, fmt.Errorf("embed batch: %w", err)
 	}
 
-	if len(vectors) != len(texts) {
-		return nil, fmt.Errorf("count mismatch: got %d, want %d", len(vectors), len(texts))
+	if len(embedded) != len(batch) {
+		return nil, fmt.Errorf("count mismatch: got %d, want %d", len(embedded), len(batch))
 	}
 
 	// Validate dimensions
-	for i, v := range vectors {
+	for j, v := range embedded {
 		if len(v) != e.dimension {
-			return nil, fmt.Errorf("embedding %d dimension mismatch: got %d, want %d", i, len(v), e.dimension)
+			return nil, fmt.Errorf("embedding %d dimension mismatch: got %d, want %d", missing[j], len(v), e.dimension)
 		}
 	}
 
@@ -144,6 +213,13 @@ func (e *Embedder) EmbedBatch(ctx context.Context, texts []string) ([][]float32,
 		e.metrics.RecordTiming(metrics.OpEmbedding, duration)
 	}
 
+	for j, i := range missing {
+		vectors[i] = embedded[j]
+		if e.cache != nil {
+			e.cache.Add(keys[i], embedded[j])
+		}
+	}
+
 	return vectors, nil
 }
 
@@ -179,7 +255,7 @@ func newBedrockEmbedder(ctx context.Context, modelID, providerHint string) (embe
 		} else if strings.HasPrefix(modelID, "arn:") {
 			return nil, fmt.Errorf("KNOWHOW_BEDROCK_EMBED_MODEL_PROVIDER required for ARN-based model: %s", modelID)
 		} else {
-			provider = strings.Split(modelID, ".")[0]
+			provider, _, _ = strings.Cut(modelID, ".")
 		}
 	}
 
@@ -0,0 +1,66 @@
+package llm
+
+import (
+	"context"
+	"crypto/sha256"
+	"testing"
+
+	lru "github.com/hashicorp/golang-lru/v2"
+)
+
+// fakeEmbedder returns one-dimensional vectors holding the text length and
+// records the batches it was asked to embed.
+type fakeEmbedder struct {
+	batches [][]string
+}
+
+func (f *fakeEmbedder) EmbedDocuments(_ context.Context, texts []string) ([][]float32, error) {
+	f.batches = append(f.batches, texts)
+	vecs := make([][]float32, len(texts))
+	for i, t := range texts {
+		vecs[i] = []float32{float32(len(t))}
+	}
+	return vecs, nil
+}
+
+func (f *fakeEmbedder) EmbedQuery(_ context.Context, text string) ([]float32, error) {
+	return []float32{float32(len(text))}, nil
+}
+
+func TestEmbedBatch_SortsByLengthAndKeepsOrder(t *testing.T) {
+	cache, err := lru.New[embedCacheKey, []float32](16)
+	if err != nil {
+		t.Fatalf("create cache: %v", err)
+	}
+	fake := &fakeEmbedder{}
+	e := &Embedder{model: fake, dimension: 1, cache: cache}
+
+	cache.Add(sha256.Sum256([]byte("cached")), []float32{-1})
+	texts := []string{"medium", "a much longer text", "cached", "s"}
+
+	vectors, err := e.EmbedBatch(context.Background(), texts)
+	if err != nil {
+		t.Fatalf("EmbedBatch() error = %v", err)
+	}
+
+	want := []float32{6, 18, -1, 1}
+	for i, v := range vectors {
+		if v[0] != want[i] {
+			t.Errorf("vectors[%d] = %v, want %v", i, v[0], want[i])
+		}
+	}
+
+	if len(fake.batches) != 1 {
+		t.Fatalf("expected 1 provider call, got %d", len(fake.batches))
+	}
+	sent := fake.batches[0]
+	wantSent := []string{"s", "medium", "a much longer text"}
+	if len(sent) != len(wantSent) {
+		t.Fatalf("sent %q, want %q", sent, wantSent)
+	}
+	for i := range sent {
+		if sent[i] != wantSent[i] {
+			t.Errorf("sent[%d] = %q, want %q", i, sent[i], wantSent[i])
+		}
+	}
+}
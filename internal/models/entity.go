@@ -45,7 +45,7 @@ type Entity struct {
 	// Type-specific data
 	Metadata map[string]any `json:"metadata,omitempty"`
 
-	// Search
+	// Search (omitted by read queries; only written)
 	Embedding []float32 `json:"embedding,omitempty"`
 
 	// Timestamps
@@ -53,6 +53,9 @@ type Entity struct {
 	UpdatedAt   time.Time `json:"updated_at"`
 	Accessed    time.Time `json:"accessed"`
 	AccessCount int       `json:"access_count"`
+
+	// Graph edges in both directions; only loaded on request by AccessEntity/AccessEntityByName
+	Relations []Relation `json:"relations,omitempty"`
 }
 
 // EntityInput is the input structure for creating/updating entities.
@@ -68,6 +68,25 @@ func ChunkMarkdown(doc *MarkdownDoc, config ChunkConfig) []ChunkResult {
 	return chunkByParagraphs(doc.Content, config)
 }
 
+// SplitText splits plain text into overlapping windows along paragraph and
+// sentence boundaries. Content at or below config.Threshold is returned as a
+// single window.
+func SplitText(content string, config ChunkConfig) []string {
+	if strings.TrimSpace(content) == "" {
+		return nil
+	}
+	if !ShouldChunk(content, config) {
+		return []string{content}
+	}
+
+	chunks := applyOverlap(chunkByParagraphs(content, config), config.Overlap)
+	windows := make([]string, len(chunks))
+	for i, c := range chunks {
+		windows[i] = c.Content
+	}
+	return windows
+}
+
 // chunkBySections creates chunks from document sections.
 // Empty sections are skipped - they have no semantic value for RAG.
 func chunkBySections(sections []Section, config ChunkConfig) []ChunkResult {
@@ -251,3 +251,33 @@ func TestApplyOverlap_EdgeCases(t *testing.T) {
 		t.Errorf("zero overlap should not modify chunks, got %q", result[1].Content)
 	}
 }
+
+func TestSplitText(t *testing.T) {
+	config := ChunkConfig{Threshold: 100, TargetSize: 100, MaxSize: 100, Overlap: 20}
+
+	if got := SplitText("   \n\n ", config); len(got) != 0 {
+		t.Errorf("whitespace input should return no windows, got %d", len(got))
+	}
+
+	short := "A short note."
+	if got := SplitText(short, config); len(got) != 1 || got[0] != short {
+		t.Errorf("short input should be returned as-is, got %q", got)
+	}
+
+	para := strings.Repeat("Some sentence here. ", 4)
+	long := strings.Join([]string{para, para, para, para}, "\n\n")
+	got := SplitText(long, config)
+	if len(got) < 2 {
+		t.Fatalf("long input should be split, got %d windows", len(got))
+	}
+	for i, w := range got {
+		if len(w) > config.MaxSize+config.Overlap+1 {
+			t.Errorf("window %d too large: %d chars", i, len(w))
+		}
+	}
+	// The second window is prefixed with the tail of the first one
+	idx := strings.Index(got[1], " Some sentence here.")
+	if idx <= 0 || !strings.HasSuffix(got[0], got[1][:idx]) {
+		t.Errorf("second window should start with overlap from the first, got %q", got[1])
+	}
+}
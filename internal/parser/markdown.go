@@ -10,6 +10,14 @@ import (
 	"gopkg.in/yaml.v3"
 )
 
+// Patterns used by the parsers, compiled once at package init.
+var (
+	h1Regex      = regexp.MustCompile(`(?m)^#\s+(.+)$`)
+	headingRegex = regexp.MustCompile(`^(#{1,6})\s+(.+)$`)
+	linkRegex    = regexp.MustCompile(`\[\[([^\]]+)\]\]`)
+	mentionRegex = regexp.MustCompile(`@([a-zA-Z0-9_-]+)`)
+)
+
 // MarkdownDoc represents a parsed Markdown document.
 type MarkdownDoc struct {
 	// Frontmatter metadata (from YAML)
@@ -79,7 +87,6 @@ func extractTitle(fm map[string]any, content string) string {
 	}
 
 	// Find first h1
-	h1Regex := regexp.MustCompile(`(?m)^#\s+(.+)$`)
 	if match := h1Regex.FindStringSubmatch(content); len(match) > 1 {
 		return strings.TrimSpace(match[1])
 	}
@@ -90,7 +97,6 @@ func extractTitle(fm map[string]any, content string) string {
 // parseSections extracts sections from Markdown content.
 func parseSections(content string) []Section {
 	var sections []Section
-	headingRegex := regexp.MustCompile(`^(#{1,6})\s+(.+)$`)
 
 	scanner := bufio.NewScanner(strings.NewReader(content))
 	lineNum := 0
@@ -173,7 +179,6 @@ func (d *MarkdownDoc) GetFrontmatterStringSlice(key string) []string {
 
 // ExtractWikiLinks finds [[wiki-style]] links in content.
 func ExtractWikiLinks(content string) []string {
-	linkRegex := regexp.MustCompile(`\[\[([^\]]+)\]\]`)
 	matches := linkRegex.FindAllStringSubmatch(content, -1)
 
 	links := make([]string, 0, len(matches))
@@ -190,7 +195,6 @@ func ExtractWikiLinks(content string) []string {
 
 // ExtractMentions finds @mentions in content.
 func ExtractMentions(content string) []string {
-	mentionRegex := regexp.MustCompile(`@([a-zA-Z0-9_-]+)`)
 	matches := mentionRegex.FindAllStringSubmatch(content, -1)
 
 	mentions := make([]string, 0, len(matches))
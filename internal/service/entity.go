@@ -57,23 +57,12 @@ func (s *EntityService) Create(ctx context.Context, input models.EntityInput) (*
 	// Check if content will be chunked - if so, skip entity-level embedding
 	willChunk := input.Content != nil && parser.ShouldChunk(*input.Content, parser.DefaultChunkConfig())
 
-	// Generate embedding from content/summary (skip if content will be chunked)
-	if s.embedder != nil && !willChunk {
-		text := ""
-		if input.Summary != nil {
-			text = *input.Summary
-		}
-		if input.Content != nil {
-			if text != "" {
-				text += " "
-			}
-			text += *input.Content
-		}
-		if input.Name != "" {
-			text = input.Name + " " + text
-		}
-
-		if text != "" {
+	// Generate embedding from content/summary (skip if content will be chunked
+	// or the caller already embedded it as part of a batch)
+	if input.Embedding != nil {
+		slog.Debug("using precomputed entity embedding", "name", input.Name)
+	} else if s.embedder != nil && !willChunk {
+		if text := entityEmbeddingText(input); text != "" {
 			embedding, err := s.embedder.Embed(ctx, text)
 			if err != nil {
 				return nil, fmt.Errorf("generate embedding: %w", err)
@@ -115,8 +104,8 @@ func (s *EntityService) Create(ctx context.Context, input models.EntityInput) (*
 
 	result := &CreateResult{Entity: entity}
 
-	// Check if content should be chunked (skip if content is empty)
-	if input.Content != nil && *input.Content != "" && parser.ShouldChunk(*input.Content, parser.DefaultChunkConfig()) {
+	// Chunk long content (willChunk was decided before embedding)
+	if willChunk {
 		idStr, idErr := models.RecordIDString(entity.ID)
 		if idErr != nil {
 			slog.Warn("failed to get entity ID for chunking", "error", idErr)
@@ -146,6 +135,25 @@ func (s *EntityService) Create(ctx context.Context, input models.EntityInput) (*
 	return result, nil
 }
 
+// entityEmbeddingText builds the text used for an entity-level embedding:
+// name, then summary, then content.
+func entityEmbeddingText(input models.EntityInput) string {
+	text := ""
+	if input.Summary != nil {
+		text = *input.Summary
+	}
+	if input.Content != nil {
+		if text != "" {
+			text += " "
+		}
+		text += *input.Content
+	}
+	if input.Name != "" {
+		text = input.Name + " " + text
+	}
+	return text
+}
+
 // chunkEntity creates chunks for an entity with long content.
 // Returns the number of chunks created.
 func (s *EntityService) chunkEntity(ctx context.Context, entity *models.Entity) (int, error) {
@@ -357,17 +365,9 @@ func (s *EntityService) UpdateContent(ctx context.Context, id string, content st
 }
 
 // Get retrieves an entity by ID and updates access tracking.
-func (s *EntityService) Get(ctx context.Context, id string) (*models.Entity, error) {
-	entity, err := s.db.GetEntity(ctx, id)
-	if err != nil {
-		return nil, err
-	}
-	if entity != nil {
-		if err := s.db.UpdateEntityAccess(ctx, id); err != nil {
-			slog.Warn("failed to update entity access", "entity", id, "error", err)
-		}
-	}
-	return entity, nil
+// withRelations also loads the entity's relations.
+func (s *EntityService) Get(ctx context.Context, id string, withRelations bool) (*models.Entity, error) {
+	return s.db.AccessEntity(ctx, id, withRelations)
 }
 
 // Delete deletes an entity by ID (chunks/relations cascade deleted by DB).
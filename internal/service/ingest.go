@@ -2,6 +2,8 @@ package service
 
 import (
 	"context"
+	"crypto/sha256"
+	"encoding/hex"
 	"errors"
 	"fmt"
 	"log/slog"
@@ -15,8 +17,26 @@ import (
 	"github.com/raphaelgruber/memcp-go/internal/llm"
 	"github.com/raphaelgruber/memcp-go/internal/models"
 	"github.com/raphaelgruber/memcp-go/internal/parser"
+	"golang.org/x/sync/errgroup"
 )
 
+// extractedEntityAttempts bounds how often an extracted entity write is tried
+// when it hits a transaction conflict with a concurrent ingest worker.
+const extractedEntityAttempts = 3
+
+// graphExtractionConcurrency bounds the parallel LLM calls issued for the
+// windows of a single document during graph extraction.
+const graphExtractionConcurrency = 3
+
+// graphExtractionChunkConfig splits long documents into overlapping windows
+// for graph extraction so each prompt stays small.
+var graphExtractionChunkConfig = parser.ChunkConfig{
+	Threshold:  3000,
+	TargetSize: 3000,
+	MaxSize:    3000,
+	Overlap:    200,
+}
+
 // IngestService handles file ingestion into the knowledge base.
 type IngestService struct {
 	db            *db.Client
@@ -53,6 +73,8 @@ type IngestOptions struct {
 	Job *Job
 	// BaseDir is used to compute unique entity IDs (e.g., "insights" from ~/.claude/insights)
 	BaseDir string
+	// SkipUnchanged skips files whose entity already stores the same content hash
+	SkipUnchanged bool
 }
 
 // IngestResult summarizes an ingestion operation.
@@ -88,6 +110,9 @@ type IngestFilesInput struct {
 type IngestFileResult struct {
 	Entity        *models.Entity
 	ChunksCreated int
+	// Skipped is set when the file's entity already stores the same content hash
+	// and nothing was re-embedded or written.
+	Skipped bool
 }
 
 // CheckHashes determines which files need uploading based on their content hashes.
@@ -132,25 +157,52 @@ func (s *IngestService) CheckHashes(ctx context.Context, files []FileHash) ([]st
 // Used by the two-phase hash-based ingestion flow.
 // baseDir is used to compute unique entity IDs from relative file paths.
 func (s *IngestService) IngestFileWithContent(ctx context.Context, filePath, content, contentHash, baseDir string, opts IngestOptions) (*IngestFileResult, error) {
-	return s.ingestFileInternal(ctx, filePath, []byte(content), &contentHash, baseDir, opts)
+	return s.ingestFileInternal(ctx, filePath, content, &contentHash, baseDir, opts)
 }
 
 // IngestFile ingests a single Markdown file.
+// The content hash is stored with the entity; with opts.SkipUnchanged, a file
+// whose entity already has the same hash is skipped instead of being re-embedded.
 func (s *IngestService) IngestFile(ctx context.Context, filePath string, opts IngestOptions) (*IngestFileResult, error) {
 	// Read file
 	content, err := os.ReadFile(filePath)
 	if err != nil {
 		return nil, fmt.Errorf("read file: %w", err)
 	}
-	return s.ingestFileInternal(ctx, filePath, content, nil, opts.BaseDir, opts)
+
+	hash := sha256.Sum256(content)
+	contentHash := hex.EncodeToString(hash[:])
+	if entityID := fileEntityID(opts.BaseDir, filePath); opts.SkipUnchanged && !opts.DryRun && entityID != nil {
+		stored, err := s.db.GetContentHash(ctx, *entityID)
+		if err != nil {
+			slog.Warn("failed to check content hash, ingesting anyway", "file", filePath, "error", err)
+		} else if stored != nil && *stored == contentHash {
+			slog.Debug("skipping unchanged file", "file", filePath)
+			return &IngestFileResult{Skipped: true}, nil
+		}
+	}
+
+	return s.ingestFileInternal(ctx, filePath, string(content), &contentHash, opts.BaseDir, opts)
+}
+
+// fileEntityID computes a file's entity ID from baseDir + filename for uniqueness,
+// e.g. baseDir="insights", filePath=".../2026-02-04-tests-abc.md" → "insights-2026-02-04-tests-abc".
+// Returns nil when baseDir is empty, leaving the ID to be derived from the name.
+func fileEntityID(baseDir, filePath string) *string {
+	if baseDir == "" {
+		return nil
+	}
+	filename := strings.TrimSuffix(filepath.Base(filePath), filepath.Ext(filePath))
+	id := slugify(baseDir + "-" + filename)
+	return &id
 }
 
 // ingestFileInternal handles the core ingestion logic for both IngestFile and IngestFileWithContent.
 // If contentHash is nil, no hash is stored; if provided, it's stored for skip-unchanged deduplication.
 // baseDir is used to compute unique entity IDs: baseDir + filename (without ext). If empty, uses name.
-func (s *IngestService) ingestFileInternal(ctx context.Context, filePath string, content []byte, contentHash *string, baseDir string, opts IngestOptions) (*IngestFileResult, error) {
+func (s *IngestService) ingestFileInternal(ctx context.Context, filePath string, content string, contentHash *string, baseDir string, opts IngestOptions) (*IngestFileResult, error) {
 	// Parse markdown
-	doc, err := parser.ParseMarkdown(string(content))
+	doc, err := parser.ParseMarkdown(content)
 	if err != nil {
 		return nil, fmt.Errorf("parse markdown: %w", err)
 	}
@@ -167,14 +219,7 @@ func (s *IngestService) ingestFileInternal(ctx context.Context, filePath string,
 		name = strings.TrimSuffix(filepath.Base(filePath), filepath.Ext(filePath))
 	}
 
-	// Compute entity ID from baseDir + filename for uniqueness
-	// e.g., baseDir="insights", filePath=".../2026-02-04-tests-abc.md" → ID="insights-2026-02-04-tests-abc"
-	var entityID *string
-	if baseDir != "" {
-		filename := strings.TrimSuffix(filepath.Base(filePath), filepath.Ext(filePath))
-		id := slugify(baseDir + "-" + filename)
-		entityID = &id
-	}
+	entityID := fileEntityID(baseDir, filePath)
 
 	// Merge labels from frontmatter and options
 	labels := doc.GetFrontmatterStringSlice("labels")
@@ -234,11 +279,9 @@ func (s *IngestService) ingestFileInternal(ctx context.Context, filePath string,
 
 	// Extract relations from content
 	relations := s.extractInferredRelations(ctx, doc, createResult.Entity)
-	for _, rel := range relations {
-		if err := s.db.CreateRelation(ctx, rel); err != nil {
-			// Log but don't fail
-			slog.Warn("failed to create inferred relation", "from", rel.FromID, "to", rel.ToID, "error", err)
-		}
+	if err := s.db.CreateRelations(ctx, relations); err != nil {
+		// Log but don't fail
+		slog.Warn("failed to create inferred relations", "entity", createResult.Entity.Name, "count", len(relations), "error", err)
 	}
 
 	// Extract graph relations using LLM if requested
@@ -354,6 +397,198 @@ func (s *IngestService) extractInferredRelations(ctx context.Context, doc *parse
 	return relations
 }
 
+// extractFromWindows runs LLM graph extraction over overlapping windows of
+// content in parallel and concatenates the raw outputs in window order.
+// Short content is sent as a single prompt.
+//
+// A window that fails is logged and left out, so one bad response doesn't
+// discard the others. A fatal API error cancels the remaining windows.
+func (s *IngestService) extractFromWindows(ctx context.Context, content string, entityNames []string) (string, error) {
+	windows := parser.SplitText(content, graphExtractionChunkConfig)
+	if len(windows) <= 1 {
+		return s.model.ExtractEntitiesAndRelations(ctx, content, entityNames)
+	}
+
+	slog.Debug("graph extraction split into windows", "windows", len(windows))
+
+	results := make([]string, len(windows))
+	errs := make([]error, len(windows))
+	g, gctx := errgroup.WithContext(ctx)
+	g.SetLimit(graphExtractionConcurrency)
+
+	for i, window := range windows {
+		g.Go(func() error {
+			out, err := s.model.ExtractEntitiesAndRelations(gctx, window, entityNames)
+			if err != nil {
+				if errors.Is(err, llm.ErrFatalAPI) {
+					return err
+				}
+				slog.Warn("graph extraction failed for window", "window", i+1, "windows", len(windows), "error", err)
+				errs[i] = err
+				return nil
+			}
+			results[i] = out
+			return nil
+		})
+	}
+	if err := g.Wait(); err != nil {
+		return "", err
+	}
+
+	failed := 0
+	for _, err := range errs {
+		if err != nil {
+			failed++
+		}
+	}
+	if failed == len(windows) {
+		return "", errors.Join(errs...)
+	}
+	return strings.Join(results, "\n"), nil
+}
+
+// graphExtraction is the parsed output of an LLM graph extraction.
+type graphExtraction struct {
+	entities  []extractedEntity   // unique by case-insensitive name
+	relations []extractedRelation // unique by source, target and type
+}
+
+// extractedEntity is an ENTITY|name|type|description line.
+type extractedEntity struct {
+	name        string
+	entityType  string
+	description string
+}
+
+// extractedRelation is a RELATION|source|target|type|description line.
+type extractedRelation struct {
+	source  string
+	target  string
+	relType string
+}
+
+// input converts an extracted entity to an AI-generated, unverified entity.
+func (e extractedEntity) input() models.EntityInput {
+	description := e.description
+	aiSource := models.SourceAIGenerated
+	verified := false
+	confidence := 0.7
+	return models.EntityInput{
+		Type:       e.entityType,
+		Name:       e.name,
+		Summary:    &description,
+		Source:     &aiSource,
+		Verified:   &verified,
+		Confidence: &confidence,
+	}
+}
+
+// parseGraphExtraction parses ENTITY and RELATION lines from LLM output,
+// ignoring prose and malformed lines. Overlapping windows can report the same
+// entity or relation twice, so both are deduplicated.
+func parseGraphExtraction(output string) graphExtraction {
+	var parsed graphExtraction
+	seenEntities := make(map[string]bool)
+	seenRelations := make(map[extractedRelation]bool)
+
+	for _, line := range strings.Split(output, "\n") {
+		// Only split lines tagged as ENTITY or RELATION; the rest is prose
+		kind, rest, ok := strings.Cut(line, "|")
+		kind = strings.TrimSpace(kind)
+		if !ok || (kind != "ENTITY" && kind != "RELATION") {
+			continue
+		}
+		parts := strings.Split(rest, "|")
+		for i := range parts {
+			parts[i] = strings.TrimSpace(parts[i])
+		}
+
+		if kind == "RELATION" {
+			if len(parts) < 4 {
+				continue
+			}
+			rel := extractedRelation{source: parts[0], target: parts[1], relType: parts[2]}
+			if !seenRelations[rel] {
+				seenRelations[rel] = true
+				parsed.relations = append(parsed.relations, rel)
+			}
+			continue
+		}
+		if len(parts) < 3 {
+			continue
+		}
+
+		// Names are matched case-insensitively, like the entity lookups
+		name := parts[0]
+		if name == "" || seenEntities[strings.ToLower(name)] {
+			continue
+		}
+		seenEntities[strings.ToLower(name)] = true
+		parsed.entities = append(parsed.entities, extractedEntity{
+			name:        name,
+			entityType:  parts[1],
+			description: parts[2],
+		})
+	}
+	return parsed
+}
+
+// names returns every entity name referenced by the extraction, unique by
+// case-insensitive name: extracted entities first, then relation endpoints.
+func (g graphExtraction) names() []string {
+	seen := make(map[string]bool)
+	var names []string
+	add := func(name string) {
+		if !seen[strings.ToLower(name)] {
+			seen[strings.ToLower(name)] = true
+			names = append(names, name)
+		}
+	}
+	for _, e := range g.entities {
+		add(e.name)
+	}
+	for _, rel := range g.relations {
+		add(rel.source)
+		add(rel.target)
+	}
+	return names
+}
+
+// graphRelationInputs builds the relations to store for an extraction from
+// the source entity: extracted relations between resolved entities, plus a
+// "mentions" link to each extracted entity. idByName maps lowercased names to
+// entity IDs; relations with an unresolved endpoint are dropped.
+func graphRelationInputs(entityID string, g graphExtraction, idByName map[string]string) []models.RelationInput {
+	relSource := string(models.RelationSourceAIDetected)
+	var relations []models.RelationInput
+
+	for _, rel := range g.relations {
+		sourceID, srcOK := idByName[strings.ToLower(rel.source)]
+		targetID, tgtOK := idByName[strings.ToLower(rel.target)]
+		if srcOK && tgtOK {
+			relations = append(relations, models.RelationInput{
+				FromID:  sourceID,
+				ToID:    targetID,
+				RelType: rel.relType,
+				Source:  &relSource,
+			})
+		}
+	}
+
+	// Also link extracted entities to the source entity
+	for _, e := range g.entities {
+		if targetID, ok := idByName[strings.ToLower(e.name)]; ok {
+			relations = append(relations, models.RelationInput{
+				FromID:  entityID,
+				ToID:    targetID,
+				RelType: "mentions",
+				Source:  &relSource,
+			})
+		}
+	}
+	return relations
+}
+
 // extractGraphRelations uses LLM to extract entity relationships (GraphRAG-style).
 func (s *IngestService) extractGraphRelations(ctx context.Context, entity *models.Entity) error {
 	if entity.Content == nil || s.model == nil {
@@ -369,129 +604,115 @@ func (s *IngestService) extractGraphRelations(ctx context.Context, entity *model
 	slog.Debug("starting graph extraction", "entity", entity.Name, "content_len", contentLen)
 
 	// Get existing entity names for context
-	existingEntities, err := s.db.ListEntities(ctx, "", nil, 100)
+	entityNames, err := s.db.ListEntityNames(ctx, 100)
 	if err != nil {
 		slog.Warn("failed to list entities for graph context", "error", err)
 		// Continue with empty list - LLM can still extract new entities
 	}
-	entityNames := make([]string, 0, len(existingEntities))
-	for _, e := range existingEntities {
-		entityNames = append(entityNames, e.Name)
-	}
 
 	// Extract entities and relations using LLM
-	result, err := s.model.ExtractEntitiesAndRelations(ctx, *entity.Content, entityNames)
+	result, err := s.extractFromWindows(ctx, *entity.Content, entityNames)
 	if err != nil {
 		return fmt.Errorf("LLM extraction: %w", err)
 	}
 
-	// Parse LLM output
-	lines := strings.Split(result, "\n")
+	// Entities are created first so that new ones can be embedded in a single
+	// batch before relations are resolved
+	parsed := parseGraphExtraction(result)
 
-	for _, line := range lines {
-		line = strings.TrimSpace(line)
-		parts := strings.Split(line, "|")
+	// Create the extracted entities that don't exist yet, checking all names
+	// with one query instead of one lookup per name
+	extractedNames := make([]string, len(parsed.entities))
+	for i, e := range parsed.entities {
+		extractedNames[i] = e.name
+	}
+	existing, err := s.db.GetEntitiesByNames(ctx, extractedNames)
+	if err != nil {
+		return fmt.Errorf("check existing extracted entities: %w", err)
+	}
+	var newEntities []models.EntityInput
+	for _, e := range parsed.entities {
+		if existing[strings.ToLower(e.name)] == nil {
+			newEntities = append(newEntities, e.input())
+		}
+	}
 
-		if len(parts) >= 4 && parts[0] == "ENTITY" {
-			// Create new entity if it doesn't exist
-			name := strings.TrimSpace(parts[1])
-			existing, err := s.db.GetEntityByName(ctx, name)
-			if err != nil {
-				slog.Warn("failed to check existing entity for graph extraction", "name", name, "error", err)
-				continue
-			}
-			if existing == nil {
-				entityType := strings.TrimSpace(parts[2])
-				description := strings.TrimSpace(parts[3])
-				aiSource := models.SourceAIGenerated
-				verified := false
-				confidence := 0.7
-
-				_, err := s.entityService.Create(ctx, models.EntityInput{
-					Type:       entityType,
-					Name:       name,
-					Summary:    &description,
-					Source:     &aiSource,
-					Verified:   &verified,
-					Confidence: &confidence,
-				})
-				if err != nil {
-					// Race condition: entity may have been created by another worker
-					// Handle both "already exists" and transaction conflicts
-					if errors.Is(err, db.ErrEntityAlreadyExists) || errors.Is(err, db.ErrTransactionConflict) {
-						slog.Debug("entity already exists or conflict, skipping extraction", "name", name)
-					} else {
-						slog.Warn("failed to create entity from graph extraction", "name", name, "error", err)
-					}
-				}
-			}
+	s.createExtractedEntities(ctx, newEntities)
+
+	// Resolve every name referenced by a relation or mention in one query
+	byName, err := s.db.GetEntitiesByNames(ctx, parsed.names())
+	if err != nil {
+		return fmt.Errorf("resolve graph extraction entities: %w", err)
+	}
+	idByName := make(map[string]string, len(byName))
+	for key, entity := range byName {
+		id, err := models.RecordIDString(entity.ID)
+		if err != nil {
+			slog.Debug("failed to get ID for extracted entity", "name", key, "error", err)
+			continue
 		}
+		idByName[key] = id
+	}
 
-		if len(parts) >= 5 && parts[0] == "RELATION" {
-			sourceName := strings.TrimSpace(parts[1])
-			targetName := strings.TrimSpace(parts[2])
-			relType := strings.TrimSpace(parts[3])
+	// Relations are collected and written in one query at the end
+	relations := graphRelationInputs(entityID, parsed, idByName)
 
-			// Find source and target entities
-			sourceEntity, err := s.db.GetEntityByName(ctx, sourceName)
-			if err != nil {
-				slog.Debug("failed to lookup source entity for relation", "source", sourceName, "error", err)
-				continue
-			}
-			targetEntity, err := s.db.GetEntityByName(ctx, targetName)
-			if err != nil {
-				slog.Debug("failed to lookup target entity for relation", "target", targetName, "error", err)
-				continue
-			}
+	if err := s.db.CreateRelations(ctx, relations); err != nil {
+		slog.Warn("failed to create relations from graph extraction", "entity", entityID, "count", len(relations), "error", err)
+	}
 
-			if sourceEntity != nil && targetEntity != nil {
-				sourceID, srcErr := models.RecordIDString(sourceEntity.ID)
-				targetID, tgtErr := models.RecordIDString(targetEntity.ID)
-				if srcErr == nil && tgtErr == nil {
-					relSource := string(models.RelationSourceAIDetected)
-
-					err := s.db.CreateRelation(ctx, models.RelationInput{
-						FromID:  sourceID,
-						ToID:    targetID,
-						RelType: relType,
-						Source:  &relSource,
-					})
-					if err != nil {
-						slog.Warn("failed to create relation from graph extraction", "source", sourceName, "target", targetName, "error", err)
-					}
-				}
-			}
-		}
+	return nil
+}
 
-		// Also link extracted entities to the source entity
-		if len(parts) >= 4 && parts[0] == "ENTITY" {
-			name := strings.TrimSpace(parts[1])
-			targetEntity, err := s.db.GetEntityByName(ctx, name)
-			if err != nil {
-				slog.Debug("failed to lookup extracted entity", "name", name, "error", err)
-				continue
-			}
-			if targetEntity != nil {
-				targetID, err := models.RecordIDString(targetEntity.ID)
-				if err != nil {
-					slog.Debug("failed to get target ID for extracted entity", "name", name, "error", err)
-					continue
-				}
-				relSource := string(models.RelationSourceAIDetected)
-
-				if err := s.db.CreateRelation(ctx, models.RelationInput{
-					FromID:  entityID,
-					ToID:    targetID,
-					RelType: "mentions",
-					Source:  &relSource,
-				}); err != nil {
-					slog.Warn("failed to create mentions relation from graph extraction", "entity", entityID, "target", targetID, "error", err)
-				}
+// createExtractedEntities creates entities discovered by graph extraction.
+// Their embeddings are generated with one batch call instead of one embedding
+// request per entity; if the batch fails, Create embeds each entity itself.
+func (s *IngestService) createExtractedEntities(ctx context.Context, inputs []models.EntityInput) {
+	if len(inputs) == 0 {
+		return
+	}
+
+	if s.embedder != nil {
+		texts := make([]string, len(inputs))
+		for i := range inputs {
+			texts[i] = entityEmbeddingText(inputs[i])
+		}
+		embeddings, err := s.embedder.EmbedBatch(ctx, texts)
+		if err != nil {
+			slog.Warn("failed to batch embed extracted entities, embedding individually", "count", len(inputs), "error", err)
+		} else {
+			for i := range inputs {
+				inputs[i].Embedding = embeddings[i]
 			}
 		}
 	}
 
-	return nil
+	// Written one at a time: concurrent writes to the entity indexes cause
+	// transaction conflicts, and ingest workers already run files in parallel
+	for _, input := range inputs {
+		s.createExtractedEntity(ctx, input)
+	}
+}
+
+// createExtractedEntity creates one extracted entity, retrying on transaction
+// conflicts. An entity that already exists is skipped.
+func (s *IngestService) createExtractedEntity(ctx context.Context, input models.EntityInput) {
+	for attempt := 1; ; attempt++ {
+		_, err := s.entityService.Create(ctx, input)
+		switch {
+		case err == nil:
+			return
+		case errors.Is(err, db.ErrEntityAlreadyExists):
+			// Race condition: entity may have been created by another worker
+			slog.Debug("entity already exists, skipping extraction", "name", input.Name)
+			return
+		case errors.Is(err, db.ErrTransactionConflict) && attempt < extractedEntityAttempts:
+			slog.Debug("transaction conflict creating extracted entity, retrying", "name", input.Name, "attempt", attempt)
+		default:
+			slog.Warn("failed to create entity from graph extraction", "name", input.Name, "error", err)
+			return
+		}
+	}
 }
 
 // CollectFiles walks a directory and returns all markdown files.
@@ -646,6 +867,7 @@ func (s *IngestService) processFilesInternal(ctx context.Context, jobManager *Jo
 	// Result aggregation with thread-safe counters
 	var (
 		filesProcessed  atomic.Int32
+		filesSkipped    atomic.Int32
 		entitiesCreated atomic.Int32
 		chunksCreated   atomic.Int32
 		errorsMu        sync.Mutex
@@ -693,6 +915,12 @@ func (s *IngestService) processFilesInternal(ctx context.Context, jobManager *Jo
 					continue
 				}
 
+				if result != nil && result.Skipped {
+					// Counted for progress above, but not as processed
+					filesSkipped.Add(1)
+					continue
+				}
+
 				entitiesCreated.Add(1)
 
 				// Use chunk count from result (no extra DB query needed)
@@ -712,10 +940,11 @@ func (s *IngestService) processFilesInternal(ctx context.Context, jobManager *Jo
 	// Wait for completion
 	wg.Wait()
 
-	slog.Info("file processing complete", "entities", entitiesCreated.Load(), "chunks", chunksCreated.Load(), "errors", len(errs))
+	slog.Info("file processing complete", "entities", entitiesCreated.Load(), "skipped", filesSkipped.Load(), "chunks", chunksCreated.Load(), "errors", len(errs))
 
 	return &IngestResult{
-		FilesProcessed:  int(filesProcessed.Load()),
+		FilesProcessed:  int(filesProcessed.Load() - filesSkipped.Load()),
+		FilesSkipped:    int(filesSkipped.Load()),
 		EntitiesCreated: int(entitiesCreated.Load()),
 		ChunksCreated:   int(chunksCreated.Load()),
 		Errors:          errs,
@@ -902,9 +1131,10 @@ func (s *IngestService) IngestDirectoryAsync(ctx context.Context, jobManager *Jo
 
 	// Prepare options for persistence (excluding name and labels which are now top-level)
 	persistOpts := map[string]any{
-		"extract_graph": opts.ExtractGraph,
-		"recursive":     opts.Recursive,
-		"base_dir":      baseDir,
+		"extract_graph":  opts.ExtractGraph,
+		"recursive":      opts.Recursive,
+		"base_dir":       baseDir,
+		"skip_unchanged": opts.SkipUnchanged,
 	}
 
 	// Create job with persistence
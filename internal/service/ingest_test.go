@@ -0,0 +1,227 @@
+package service
+
+import (
+	"context"
+	"fmt"
+	"log"
+	"os"
+	"path/filepath"
+	"slices"
+	"sync"
+	"testing"
+
+	"github.com/raphaelgruber/memcp-go/internal/db"
+	"github.com/raphaelgruber/memcp-go/internal/testutil"
+	"github.com/testcontainers/testcontainers-go"
+)
+
+var (
+	testDBOnce    sync.Once
+	testDB        *db.Client
+	testDBErr     error
+	testContainer testcontainers.Container
+)
+
+// TestMain tears down the SurrealDB container if any test started it.
+func TestMain(m *testing.M) {
+	code := m.Run()
+
+	ctx := context.Background()
+	if testDB != nil {
+		if err := testDB.Close(ctx); err != nil {
+			log.Printf("Failed to close test database: %v", err)
+		}
+	}
+	if testContainer != nil {
+		if err := testContainer.Terminate(ctx); err != nil {
+			log.Printf("Failed to terminate container: %v", err)
+		}
+	}
+	os.Exit(code)
+}
+
+// startTestDB starts a SurrealDB container and connects to it.
+func startTestDB(ctx context.Context) (*db.Client, error) {
+	var url string
+	var err error
+	testContainer, url, err = testutil.StartSurrealDB(ctx)
+	if err != nil {
+		return nil, err
+	}
+
+	client, err := db.NewClient(ctx, db.Config{
+		URL:       url,
+		Namespace: "test",
+		Database:  "test",
+		Username:  "root",
+		Password:  "root",
+		AuthLevel: "root",
+	}, nil, nil)
+	if err != nil {
+		return nil, fmt.Errorf("connect to test database: %w", err)
+	}
+
+	if err := client.InitSchema(ctx, 384); err != nil {
+		return client, fmt.Errorf("initialize schema: %w", err)
+	}
+	return client, nil
+}
+
+// newTestIngestService returns an IngestService backed by a SurrealDB container
+// that is started on first use. Embedding and LLM features are disabled.
+func newTestIngestService(t *testing.T) *IngestService {
+	t.Helper()
+	testDBOnce.Do(func() {
+		testDB, testDBErr = startTestDB(context.Background())
+	})
+	if testDBErr != nil {
+		t.Fatalf("Failed to set up test database: %v", testDBErr)
+	}
+	return NewIngestService(testDB, nil, nil)
+}
+
+func writeTestFile(t *testing.T, path, content string) {
+	t.Helper()
+	if err := os.WriteFile(path, []byte(content), 0o644); err != nil {
+		t.Fatalf("Failed to write %s: %v", path, err)
+	}
+}
+
+func TestIngestDirectory_SkipUnchanged(t *testing.T) {
+	svc := newTestIngestService(t)
+	ctx := context.Background()
+
+	dir := filepath.Join(t.TempDir(), "skip-unchanged")
+	if err := os.Mkdir(dir, 0o755); err != nil {
+		t.Fatalf("Failed to create dir: %v", err)
+	}
+	// Same content in two files: each still gets its own entity
+	writeTestFile(t, filepath.Join(dir, "alpha.md"), "# Alpha\n\nShared content.")
+	writeTestFile(t, filepath.Join(dir, "beta.md"), "# Alpha\n\nShared content.")
+
+	opts := IngestOptions{SkipUnchanged: true}
+
+	first, err := svc.IngestDirectory(ctx, dir, opts)
+	if err != nil {
+		t.Fatalf("First ingest failed: %v", err)
+	}
+	if first.EntitiesCreated != 2 || first.FilesSkipped != 0 {
+		t.Errorf("First ingest: expected 2 created, 0 skipped, got %d created, %d skipped", first.EntitiesCreated, first.FilesSkipped)
+	}
+
+	second, err := svc.IngestDirectory(ctx, dir, opts)
+	if err != nil {
+		t.Fatalf("Second ingest failed: %v", err)
+	}
+	if second.FilesSkipped != 2 || second.FilesProcessed != 0 || second.EntitiesCreated != 0 {
+		t.Errorf("Second ingest: expected 2 skipped, 0 processed, 0 created, got %d skipped, %d processed, %d created",
+			second.FilesSkipped, second.FilesProcessed, second.EntitiesCreated)
+	}
+
+	// Changing one file re-ingests only that file
+	writeTestFile(t, filepath.Join(dir, "alpha.md"), "# Alpha\n\nChanged content.")
+	third, err := svc.IngestDirectory(ctx, dir, opts)
+	if err != nil {
+		t.Fatalf("Third ingest failed: %v", err)
+	}
+	if third.FilesSkipped != 1 || third.FilesProcessed != 1 || third.EntitiesCreated != 1 {
+		t.Errorf("Third ingest: expected 1 skipped, 1 processed, 1 created, got %d skipped, %d processed, %d created",
+			third.FilesSkipped, third.FilesProcessed, third.EntitiesCreated)
+	}
+
+	// Without SkipUnchanged every file is ingested
+	forced, err := svc.IngestDirectory(ctx, dir, IngestOptions{})
+	if err != nil {
+		t.Fatalf("Forced ingest failed: %v", err)
+	}
+	if forced.FilesSkipped != 0 || forced.FilesProcessed != 2 {
+		t.Errorf("Forced ingest: expected 0 skipped, 2 processed, got %d skipped, %d processed", forced.FilesSkipped, forced.FilesProcessed)
+	}
+}
+
+func TestParseGraphExtraction(t *testing.T) {
+	tests := []struct {
+		name          string
+		output        string
+		wantEntities  []string
+		wantRelations []extractedRelation
+	}{
+		{
+			name:         "ignores prose and malformed lines",
+			output:       "Here is what I found:\nENTITY|auth-service|service|Handles login\nENTITY|too-short|service\nRELATION|a|b|owns\nnot|a|tagged|line\n",
+			wantEntities: []string{"auth-service"},
+		},
+		{
+			name:          "trims fields",
+			output:        "  ENTITY | jane-doe | person | Engineer  \nRELATION| jane-doe | auth-service |works_on| Maintains it",
+			wantEntities:  []string{"jane-doe"},
+			wantRelations: []extractedRelation{{source: "jane-doe", target: "auth-service", relType: "works_on"}},
+		},
+		{
+			name:         "deduplicates entities by lowercased name",
+			output:       "ENTITY|Auth-Service|service|First\nENTITY|auth-service|service|Second\nENTITY||service|Empty name",
+			wantEntities: []string{"Auth-Service"},
+		},
+		{
+			name: "deduplicates relations across windows",
+			output: "RELATION|a|b|owns|From window 1\nRELATION|a|b|owns|From window 2\n" +
+				"RELATION|a|b|depends_on|Different type",
+			wantRelations: []extractedRelation{
+				{source: "a", target: "b", relType: "owns"},
+				{source: "a", target: "b", relType: "depends_on"},
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			parsed := parseGraphExtraction(tt.output)
+
+			var names []string
+			for _, e := range parsed.entities {
+				names = append(names, e.name)
+			}
+			if !slices.Equal(names, tt.wantEntities) {
+				t.Errorf("entities = %v, want %v", names, tt.wantEntities)
+			}
+			if !slices.Equal(parsed.relations, tt.wantRelations) {
+				t.Errorf("relations = %v, want %v", parsed.relations, tt.wantRelations)
+			}
+		})
+	}
+}
+
+func TestGraphExtractionNames(t *testing.T) {
+	parsed := parseGraphExtraction("ENTITY|Jane|person|Engineer\nRELATION|jane|auth-service|works_on|Maintains it")
+	want := []string{"Jane", "auth-service"}
+	if got := parsed.names(); !slices.Equal(got, want) {
+		t.Errorf("names() = %v, want %v", got, want)
+	}
+}
+
+func TestGraphRelationInputs(t *testing.T) {
+	parsed := parseGraphExtraction(
+		"ENTITY|Jane|person|Engineer\n" +
+			"ENTITY|Unknown|concept|Not stored\n" +
+			"RELATION|jane|auth-service|works_on|Maintains it\n" +
+			"RELATION|jane|missing|owns|Endpoint doesn't resolve")
+	idByName := map[string]string{
+		"jane":         "jane-id",
+		"auth-service": "auth-id",
+	}
+
+	relations := graphRelationInputs("doc-id", parsed, idByName)
+
+	type rel struct{ from, to, relType string }
+	var got []rel
+	for _, r := range relations {
+		got = append(got, rel{r.FromID, r.ToID, r.RelType})
+	}
+	want := []rel{
+		{"jane-id", "auth-id", "works_on"},
+		{"doc-id", "jane-id", "mentions"},
+	}
+	if !slices.Equal(got, want) {
+		t.Errorf("relations = %v, want %v", got, want)
+	}
+}
@@ -183,6 +183,7 @@ func (m *JobManager) Complete(ctx context.Context, job *Job, result *IngestResul
 	if m.db != nil {
 		resultMap := map[string]any{
 			"files_processed":   result.FilesProcessed,
+			"files_skipped":     result.FilesSkipped,
 			"entities_created":  result.EntitiesCreated,
 			"chunks_created":    result.ChunksCreated,
 			"relations_created": result.RelationsCreated,
@@ -340,6 +341,12 @@ func (m *JobManager) ResumeIncompleteJobs(ctx context.Context, ingestService *In
 				if recursive, ok := dbJob.Options["recursive"].(bool); ok {
 					opts.Recursive = recursive
 				}
+				if baseDir, ok := dbJob.Options["base_dir"].(string); ok {
+					opts.BaseDir = baseDir
+				}
+				if skipUnchanged, ok := dbJob.Options["skip_unchanged"].(bool); ok {
+					opts.SkipUnchanged = skipUnchanged
+				}
 			}
 
 			result, err := ingestService.ProcessFiles(bgCtx, m, job, pendingFiles, opts)
@@ -63,15 +63,17 @@ func (s *SearchService) Search(ctx context.Context, opts SearchOptions) ([]model
 	}
 
 	// Update access for returned entities
+	ids := make([]string, 0, len(results))
 	for _, entity := range results {
 		if idStr, err := models.RecordIDString(entity.ID); err == nil {
-			if err := s.db.UpdateEntityAccess(ctx, idStr); err != nil {
-				slog.Warn("failed to update entity access", "entity", idStr, "error", err)
-			}
+			ids = append(ids, idStr)
 		} else {
 			slog.Warn("failed to get entity ID for access tracking", "error", err)
 		}
 	}
+	if err := s.db.UpdateEntitiesAccess(ctx, ids); err != nil {
+		slog.Warn("failed to update entity access", "count", len(ids), "error", err)
+	}
 
 	return results, nil
 }
@@ -103,15 +105,17 @@ func (s *SearchService) SearchWithChunks(ctx context.Context, opts SearchOptions
 	}
 
 	// Update access for returned entities
+	ids := make([]string, 0, len(results))
 	for _, result := range results {
 		if idStr, err := models.RecordIDString(result.ID); err == nil {
-			if err := s.db.UpdateEntityAccess(ctx, idStr); err != nil {
-				slog.Warn("failed to update entity access", "entity", idStr, "error", err)
-			}
+			ids = append(ids, idStr)
 		} else {
 			slog.Warn("failed to get entity ID for access tracking", "error", err)
 		}
 	}
+	if err := s.db.UpdateEntitiesAccess(ctx, ids); err != nil {
+		slog.Warn("failed to update entity access", "count", len(ids), "error", err)
+	}
 
 	return results, nil
 }
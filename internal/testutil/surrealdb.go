@@ -0,0 +1,48 @@
+// Package testutil provides helpers shared by integration tests.
+package testutil
+
+import (
+	"context"
+	"fmt"
+	"os"
+	"time"
+
+	"github.com/testcontainers/testcontainers-go"
+	"github.com/testcontainers/testcontainers-go/wait"
+)
+
+// StartSurrealDB starts a SurrealDB container with root/root credentials and
+// returns it along with its WebSocket RPC URL. Callers must terminate the
+// container when done.
+func StartSurrealDB(ctx context.Context) (testcontainers.Container, string, error) {
+	// Disable ryuk (cleanup container) as it can cause issues in some environments
+	os.Setenv("TESTCONTAINERS_RYUK_DISABLED", "true")
+
+	container, err := testcontainers.GenericContainer(ctx, testcontainers.GenericContainerRequest{
+		ContainerRequest: testcontainers.ContainerRequest{
+			Image:        "surrealdb/surrealdb:v3.0.0-beta.1",
+			ExposedPorts: []string{"8000/tcp"},
+			Cmd:          []string{"start", "--log", "info", "--user", "root", "--pass", "root"},
+			WaitingFor:   wait.ForLog("Started web server").WithStartupTimeout(60 * time.Second),
+		},
+		Started: true,
+	})
+	if err != nil {
+		return nil, "", fmt.Errorf("start SurrealDB container: %w", err)
+	}
+
+	host, err := container.Host(ctx)
+	if err != nil {
+		return container, "", fmt.Errorf("get container host: %w", err)
+	}
+	// Workaround: testcontainers may return "null" as host in some environments
+	if host == "" || host == "null" {
+		host = "localhost"
+	}
+	mappedPort, err := container.MappedPort(ctx, "8000")
+	if err != nil {
+		return container, "", fmt.Errorf("get mapped port: %w", err)
+	}
+
+	return container, fmt.Sprintf("ws://%s:%s/rpc", host, mappedPort.Port()), nil
+}